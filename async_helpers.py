@@ -0,0 +1,20 @@
+"""
+Async helpers - Thin wrappers around asyncio primitives used on hot paths
+"""
+import asyncio
+import contextvars
+import functools
+from typing import Any, Callable
+
+async def fast_to_thread(func: Callable[..., Any], /, *args, **kwargs) -> Any:
+    """asyncio.to_thread without the copy_context().run wrapper when no context variables are set"""
+    loop = asyncio.get_running_loop()
+    
+    if kwargs:
+        func = functools.partial(func, **kwargs)
+    
+    ctx = contextvars.copy_context()
+    if len(ctx):
+        return await loop.run_in_executor(None, functools.partial(ctx.run, func, *args))
+    
+    return await loop.run_in_executor(None, func, *args)
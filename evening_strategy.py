@@ -3,27 +3,125 @@ Evening Trading Strategy Tool - Optimized for tonight's session
 """
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+import sys
+import time
+from typing import Dict, List, Optional, Any, Tuple, AsyncIterator, Awaitable, Callable
 from datetime import datetime, timedelta
 import json
+from dataclasses import dataclass, asdict
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+_TIPS = (
+    "🕐 Prime Hours: 6-11 PM EST for highest activity",
+    "💰 Position Size: 2% risk per trade maximum",
+    "🛑 Stop Losses: Tight 15% stops for evening volatility",
+    "🎯 Take Profits: 25% and 50% targets, keep 20% moon bag",
+    "📊 Quality Focus: Only trade 7.5+ score opportunities",
+    "⚠️ Risk Management: Max 3 positions simultaneously",
+    "🐋 Watch Whales: Follow smart money movements",
+    "⏰ Time Limits: 4-hour session maximum",
+    "📱 Stay Alert: Evening can be volatile",
+    "💎 Moon Bags: Let 20% ride for potential 5-10x",
+)
+
+_GUIDE = "\n".join([
+    "🌙 EVENING TRADING STRATEGY GUIDE",
+    "=" * 50,
+    "",
+    "⏰ OPTIMAL TIMING:",
+    "• 6:00-7:00 PM: Setup and scanning phase",
+    "• 7:00-9:00 PM: Prime retail activity window",
+    "• 9:00-11:00 PM: Whale activity increases",
+    "• 11:00 PM+: Late night pumps (higher risk)",
+    "",
+    "💰 POSITION SIZING:",
+    "• Conservative: 1.5% per trade, max 2 positions",
+    "• Moderate: 2% per trade, max 3 positions",
+    "• Aggressive: 3% per trade, max 5 positions",
+    "",
+    "🎯 ENTRY CRITERIA:",
+    "• Overall score: 7.5+ out of 10",
+    "• Risk level: Low to Medium only",
+    "• Developer risk: Below 3.0",
+    "• Liquidity quality: Good or Excellent",
+    "• Whale sentiment: Neutral to Bullish",
+    "",
+    "🛑 EXIT STRATEGY:",
+    "• Stop Loss: 15% (tight for evening volatility)",
+    "• Take Profit 1: 25% (sell 50% of position)",
+    "• Take Profit 2: 50% (sell additional 30%)",
+    "• Moon Bag: Keep 20% for potential 5-10x",
+    "",
+    "⚠️ RISK MANAGEMENT:",
+    "• Maximum 3 simultaneous positions",
+    "• Session limit: 4 hours maximum",
+    "• Daily loss limit: 6% of account",
+    "• Trailing stops: 10% when in 10%+ profit",
+    "",
+    "🔍 WHAT TO LOOK FOR TONIGHT:",
+    "• New tokens with strong fundamentals",
+    "• Bonding curve progress: 10-70%",
+    "• Active developer engagement",
+    "• Growing community metrics",
+    "• Whale accumulation patterns",
+    "",
+    "🚫 RED FLAGS TO AVOID:",
+    "• Copy-paste projects",
+    "• Anonymous developers",
+    "• Suspicious funding patterns",
+    "• Poor liquidity conditions",
+    "• Late-stage bonding curve (>90%)",
+    "",
+    "📊 SUCCESS METRICS:",
+    "• Win rate target: 60%+",
+    "• Average return per trade: 30%+",
+    "• Maximum drawdown: <10%",
+    "• Risk-adjusted returns: Positive Sharpe ratio",
+    "",
+    "💡 PRO TIPS:",
+    "• Start small to test the enhanced system",
+    "• Use the opportunity scanner for real-time alerts",
+    "• Follow whale wallets for early signals",
+    "• Take profits systematically - don't get greedy",
+    "• Keep detailed records for continuous improvement",
+    "",
+    "⚠️ DISCLAIMER: This is educational content only.",
+    "Always do your own research and never invest more than you can afford to lose!",
+    "",
+])
+
+@dataclass(slots=True)
+class SessionConfig:
+    """Evening session trading parameters"""
+    risk_per_trade: float = 0.02   # 2% per trade (conservative for evening)
+    max_trades: int = 3            # Limit exposure
+    stop_loss: float = -0.15       # 15% stop loss
+    take_profit_1: float = 0.25    # 25% first target
+    take_profit_2: float = 0.50    # 50% second target
+    moon_bag: float = 0.20         # 20% for potential 5-10x
+    session_duration: int = 4      # 4 hour session
+
 class EveningTradingStrategy:
     """Specialized trading strategy for evening sessions"""
     
     def __init__(self):
-        self.session_config = {
-            'risk_per_trade': 0.02,  # 2% per trade (conservative for evening)
-            'max_trades': 3,         # Limit exposure
-            'stop_loss': -0.15,      # 15% stop loss
-            'take_profit_1': 0.25,   # 25% first target
-            'take_profit_2': 0.50,   # 50% second target
-            'moon_bag': 0.20,        # 20% for potential 5-10x
-            'session_duration': 4    # 4 hour session
-        }
+        self.session_config = SessionConfig()
+        
+        # Active positions in structure-of-arrays layout, one row per mint
+        self.mint_index: Dict[str, int] = {}
+        self.position_mints: List[str] = []
+        self._entry_price = np.empty(0, dtype=np.float64)
+        self._stop_loss = np.empty(0, dtype=np.float64)
+        self._tp1 = np.empty(0, dtype=np.float64)
+        self._tp2 = np.empty(0, dtype=np.float64)
+        self._size = np.empty(0, dtype=np.float64)
+        
+        # Set whenever a mint is added or removed, so run() can resync its feed subscriptions
+        self._positions_changed = asyncio.Event()
         
-        self.active_positions = {}
         self.session_stats = {
             'trades_executed': 0,
             'successful_trades': 0,
@@ -34,28 +132,37 @@ class EveningTradingStrategy:
     def start_evening_session(self, account_balance: float, risk_tolerance: str = 'moderate'):
         """Start evening trading session"""
         try:
-            self.session_stats['session_start'] = datetime.utcnow()
+            session_start = datetime.utcnow()
+            self.session_stats['session_start'] = session_start
+            self._session_start_ns = time.monotonic_ns()
             
             # Adjust config based on risk tolerance
             if risk_tolerance == 'conservative':
-                self.session_config['risk_per_trade'] = 0.015  # 1.5%
-                self.session_config['max_trades'] = 2
-                self.session_config['stop_loss'] = -0.10  # 10%
+                self.session_config.risk_per_trade = 0.015  # 1.5%
+                self.session_config.max_trades = 2
+                self.session_config.stop_loss = -0.10  # 10%
             elif risk_tolerance == 'aggressive':
-                self.session_config['risk_per_trade'] = 0.03  # 3%
-                self.session_config['max_trades'] = 5
-                self.session_config['stop_loss'] = -0.20  # 20%
+                self.session_config.risk_per_trade = 0.03  # 3%
+                self.session_config.max_trades = 5
+                self.session_config.stop_loss = -0.20  # 20%
             
             # Calculate position sizes
-            self.position_size = account_balance * self.session_config['risk_per_trade']
+            self.position_size = account_balance * self.session_config.risk_per_trade
+            self._pos_size_urgent = self.position_size * 0.7
+            self._max_exposure_cache = self.position_size * self.session_config.max_trades
+            
+            # Price multipliers only change with the session config
+            self._sl_mul = 1 + self.session_config.stop_loss
+            self._tp1_mul = 1 + self.session_config.take_profit_1
+            self._tp2_mul = 1 + self.session_config.take_profit_2
             
             logger.info(f"Evening session started - Risk: {risk_tolerance}, Position size: {self.position_size:.2f} SOL")
             
             return {
-                'session_id': f"evening_{int(datetime.utcnow().timestamp())}",
-                'config': self.session_config,
+                'session_id': f"evening_{int(session_start.timestamp())}",
+                'config': asdict(self.session_config),
                 'position_size': self.position_size,
-                'max_exposure': self.position_size * self.session_config['max_trades']
+                'max_exposure': self._max_exposure_cache
             }
             
         except Exception as e:
@@ -64,128 +171,264 @@ class EveningTradingStrategy:
     
     def evaluate_entry_opportunity(self, opportunity_signal) -> Dict[str, Any]:
         """Evaluate if we should enter a position"""
-        try:
-            # Check if we can take more positions
-            if len(self.active_positions) >= self.session_config['max_trades']:
-                return {
-                    'should_enter': False,
-                    'reason': 'Maximum positions reached'
-                }
-            
-            # Check opportunity quality
-            if opportunity_signal.overall_score < 7.5:
-                return {
-                    'should_enter': False,
-                    'reason': 'Score below threshold'
-                }
-            
-            # Check risk level
-            if opportunity_signal.risk_level in ['high', 'very_high']:
-                return {
-                    'should_enter': False,
-                    'reason': 'Risk level too high for evening session'
-                }
-            
-            # Check time sensitivity
-            if opportunity_signal.time_sensitivity == 'very_high':
-                # High urgency - reduce position size
-                position_size = self.position_size * 0.7
-            else:
-                position_size = self.position_size
-            
-            # Calculate stop loss and take profit levels
-            entry_price = 0.001  # Placeholder - would get from market data
-            stop_loss_price = entry_price * (1 + self.session_config['stop_loss'])
-            take_profit_1_price = entry_price * (1 + self.session_config['take_profit_1'])
-            take_profit_2_price = entry_price * (1 + self.session_config['take_profit_2'])
-            
+        if self.session_stats['session_start'] is None:
             return {
-                'should_enter': True,
-                'position_size': position_size,
-                'entry_price': entry_price,
-                'stop_loss': stop_loss_price,
-                'take_profit_1': take_profit_1_price,
-                'take_profit_2': take_profit_2_price,
-                'confidence': opportunity_signal.confidence_level,
-                'expected_return': opportunity_signal.potential_return
+                'should_enter': False,
+                'reason': 'No active session'
             }
-            
-        except Exception as e:
-            logger.error(f"Error evaluating entry opportunity: {str(e)}")
-            return {'should_enter': False, 'reason': 'Evaluation error'}
+        
+        # Check if we can take more positions
+        if len(self.mint_index) >= self.session_config.max_trades:
+            return {
+                'should_enter': False,
+                'reason': 'Maximum positions reached'
+            }
+        
+        # Check opportunity quality
+        overall_score = getattr(opportunity_signal, 'overall_score', None)
+        if overall_score is None or overall_score < 7.5:
+            return {
+                'should_enter': False,
+                'reason': 'Score below threshold'
+            }
+        
+        # Check risk level
+        if getattr(opportunity_signal, 'risk_level', 'unknown') in ['high', 'very_high']:
+            return {
+                'should_enter': False,
+                'reason': 'Risk level too high for evening session'
+            }
+        
+        # Check time sensitivity
+        if getattr(opportunity_signal, 'time_sensitivity', None) == 'very_high':
+            # High urgency - reduce position size
+            position_size = self._pos_size_urgent
+        else:
+            position_size = self.position_size
+        
+        # Calculate stop loss and take profit levels
+        entry_price = 0.001  # Placeholder - would get from market data
+        stop_loss_price = entry_price * self._sl_mul
+        take_profit_1_price = entry_price * self._tp1_mul
+        take_profit_2_price = entry_price * self._tp2_mul
+        
+        return {
+            'should_enter': True,
+            'position_size': position_size,
+            'entry_price': entry_price,
+            'stop_loss': stop_loss_price,
+            'take_profit_1': take_profit_1_price,
+            'take_profit_2': take_profit_2_price,
+            'confidence': getattr(opportunity_signal, 'confidence_level', 0.0),
+            'expected_return': getattr(opportunity_signal, 'potential_return', 0.0)
+        }
+    
+    def open_position(self, mint_address: str, entry_price: float, size: float,
+                      stop_loss: float, take_profit_1: float, take_profit_2: float):
+        """Track a new position (or overwrite an existing one for the same mint)"""
+        row = self.mint_index.get(mint_address)
+        if row is None:
+            row = len(self.position_mints)
+            self.mint_index[mint_address] = row
+            self.position_mints.append(mint_address)
+            self._entry_price = np.append(self._entry_price, 0.0)
+            self._stop_loss = np.append(self._stop_loss, 0.0)
+            self._tp1 = np.append(self._tp1, 0.0)
+            self._tp2 = np.append(self._tp2, 0.0)
+            self._size = np.append(self._size, 0.0)
+            self._positions_changed.set()
+        
+        self._entry_price[row] = entry_price
+        self._stop_loss[row] = stop_loss
+        self._tp1[row] = take_profit_1
+        self._tp2[row] = take_profit_2
+        self._size[row] = size
+    
+    def close_position(self, mint_address: str) -> bool:
+        """Stop tracking a position, moving the last row into its slot"""
+        row = self.mint_index.pop(mint_address, None)
+        if row is None:
+            return False
+        
+        last = len(self.position_mints) - 1
+        if row != last:
+            moved = self.position_mints[last]
+            self.position_mints[row] = moved
+            self.mint_index[moved] = row
+            for column in (self._entry_price, self._stop_loss, self._tp1, self._tp2, self._size):
+                column[row] = column[last]
+        
+        self.position_mints.pop()
+        self._entry_price = self._entry_price[:last]
+        self._stop_loss = self._stop_loss[:last]
+        self._tp1 = self._tp1[:last]
+        self._tp2 = self._tp2[:last]
+        self._size = self._size[:last]
+        self._positions_changed.set()
+        return True
     
     def manage_position(self, mint_address: str, current_price: float) -> Dict[str, Any]:
         """Manage existing position"""
+        row = self.mint_index.get(mint_address)
+        if row is None:
+            return {'action': 'none', 'reason': 'Position not found'}
+        
+        rows = np.array([row])
+        prices = np.array([current_price], dtype=np.float64)
+        return self._evaluate_rows(rows, prices, include_hold=True)[0]
+    
+    def manage_positions_batch(self, prices: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Manage all active positions in a single vectorized pass
+        
+        Args:
+            prices: Current prices aligned with ``self.position_mints``;
+                NaN marks a position without a fresh price
+        
+        Returns:
+            Actions for positions that need one; holding positions are omitted
+        """
+        rows = np.arange(len(self.position_mints))
+        return self._evaluate_rows(rows, np.asarray(prices, dtype=np.float64))
+    
+    async def run(self,
+                  price_stream: AsyncIterator[Dict[str, float]],
+                  on_actions: Callable[[List[Dict[str, Any]]], Awaitable[None]],
+                  send: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None):
+        """
+        Manage positions from a pushed price feed
+        
+        Args:
+            price_stream: Async iterator of {mint_address: price} updates
+            on_actions: Coroutine called with the actions produced by each update
+            send: Optional coroutine used to (un)subscribe mints on the feed
+        """
+        subscribed = set()
+        updates = price_stream.__aiter__()
+        next_update = asyncio.ensure_future(updates.__anext__())
+        changed = asyncio.ensure_future(self._positions_changed.wait())
+        self._positions_changed.set()
+        
         try:
-            if mint_address not in self.active_positions:
-                return {'action': 'none', 'reason': 'Position not found'}
-            
-            position = self.active_positions[mint_address]
-            entry_price = position['entry_price']
-            current_pnl_percent = (current_price - entry_price) / entry_price
+            while True:
+                # Wake on whichever comes first, so positions opened while the feed is quiet still get subscribed
+                await asyncio.wait((next_update, changed), return_when=asyncio.FIRST_COMPLETED)
+                
+                if changed.done():
+                    self._positions_changed.clear()
+                    changed = asyncio.ensure_future(self._positions_changed.wait())
+                    if send is not None:
+                        await self._sync_subscriptions(send, subscribed)
+                
+                if not next_update.done():
+                    continue
+                
+                try:
+                    update = next_update.result()
+                except StopAsyncIteration:
+                    break
+                next_update = asyncio.ensure_future(updates.__anext__())
+                
+                prices = np.full(len(self.position_mints), np.nan)
+                for mint_address, price in update.items():
+                    row = self.mint_index.get(mint_address)
+                    if row is not None:
+                        prices[row] = price
+                
+                actions = self.manage_positions_batch(prices)
+                if actions:
+                    await on_actions(actions)
+                    
+        except asyncio.CancelledError:
+            logger.info("Evening price stream cancelled")
+        finally:
+            next_update.cancel()
+            changed.cancel()
+    
+    async def _sync_subscriptions(self, send: Callable[[Dict[str, Any]], Awaitable[None]], subscribed: set):
+        """Subscribe newly opened mints and unsubscribe closed ones, once per mint"""
+        wanted = self.mint_index.keys()
+        added = [mint for mint in wanted if mint not in subscribed]
+        removed = [mint for mint in subscribed if mint not in wanted]
+        
+        if added:
+            await send({'action': 'subscribe', 'mints': added})
+            subscribed.update(added)
+        if removed:
+            await send({'action': 'unsubscribe', 'mints': removed})
+            subscribed.difference_update(removed)
+    
+    def _evaluate_rows(self, rows: np.ndarray, prices: np.ndarray,
+                       include_hold: bool = False) -> List[Dict[str, Any]]:
+        """Apply stop loss, take profit and trailing stop rules to the given rows"""
+        entry_price = self._entry_price[rows]
+        stop_loss = self._stop_loss[rows]
+        size = self._size[rows]
+        pnl = (prices - entry_price) / entry_price
+        
+        # Rules are checked in priority order, so each mask excludes the earlier ones
+        stop_hit = prices <= stop_loss
+        tp2_hit = (prices >= self._tp2[rows]) & (size > 0.2) & ~stop_hit
+        tp1_hit = (prices >= self._tp1[rows]) & (size > 0.5) & ~stop_hit & ~tp2_hit
+        
+        # Trailing stop (10%) once the position is 10%+ in profit
+        trailing_stop = prices * 0.9
+        trail = (pnl > 0.1) & (trailing_stop > stop_loss) & ~(stop_hit | tp1_hit | tp2_hit)
+        self._stop_loss[rows[trail]] = trailing_stop[trail]
+        
+        if include_hold:
+            indices = range(len(rows))
+        else:
+            indices = np.flatnonzero(stop_hit | tp1_hit | tp2_hit | trail)
+        
+        results = []
+        for i in indices:
+            mint_address = self.position_mints[rows[i]]
+            pnl_percent = float(pnl[i])
             
-            # Check stop loss
-            if current_price <= position['stop_loss']:
-                return {
+            if stop_hit[i]:
+                result = {
                     'action': 'close_all',
                     'reason': 'Stop loss triggered',
-                    'pnl_percent': current_pnl_percent
+                    'pnl_percent': pnl_percent
                 }
-            
-            # Check take profit levels
-            if current_price >= position['take_profit_2'] and position['size'] > 0.2:
+            elif tp2_hit[i]:
                 # Take profit at second level - sell 60% more
-                return {
+                result = {
                     'action': 'partial_close',
                     'close_percent': 0.6,
                     'reason': 'Take profit 2 reached',
-                    'pnl_percent': current_pnl_percent
+                    'pnl_percent': pnl_percent
                 }
-            elif current_price >= position['take_profit_1'] and position['size'] > 0.5:
+            elif tp1_hit[i]:
                 # Take profit at first level - sell 50%
-                return {
+                result = {
                     'action': 'partial_close',
                     'close_percent': 0.5,
                     'reason': 'Take profit 1 reached',
-                    'pnl_percent': current_pnl_percent
+                    'pnl_percent': pnl_percent
+                }
+            elif trail[i]:
+                result = {
+                    'action': 'update_stop',
+                    'new_stop': float(trailing_stop[i]),
+                    'reason': 'Trailing stop updated'
+                }
+            else:
+                result = {
+                    'action': 'hold',
+                    'current_pnl_percent': pnl_percent,
+                    'unrealized_pnl': float(size[i]) * pnl_percent
                 }
             
-            # Check for trailing stop (if in profit)
-            if current_pnl_percent > 0.1:  # 10% profit
-                # Implement trailing stop
-                trailing_stop = current_price * 0.9  # 10% trailing stop
-                if trailing_stop > position['stop_loss']:
-                    position['stop_loss'] = trailing_stop
-                    return {
-                        'action': 'update_stop',
-                        'new_stop': trailing_stop,
-                        'reason': 'Trailing stop updated'
-                    }
-            
-            return {
-                'action': 'hold',
-                'current_pnl_percent': current_pnl_percent,
-                'unrealized_pnl': position['size'] * current_pnl_percent
-            }
-            
-        except Exception as e:
-            logger.error(f"Error managing position: {str(e)}")
-            return {'action': 'none', 'reason': 'Management error'}
+            result['mint_address'] = mint_address
+            results.append(result)
+        
+        return results
     
-    def get_evening_strategy_tips(self) -> List[str]:
+    def get_evening_strategy_tips(self) -> Tuple[str, ...]:
         """Get strategy tips for evening trading"""
-        return [
-            "🕐 Prime Hours: 6-11 PM EST for highest activity",
-            "💰 Position Size: 2% risk per trade maximum",
-            "🛑 Stop Losses: Tight 15% stops for evening volatility",
-            "🎯 Take Profits: 25% and 50% targets, keep 20% moon bag",
-            "📊 Quality Focus: Only trade 7.5+ score opportunities",
-            "⚠️ Risk Management: Max 3 positions simultaneously",
-            "🐋 Watch Whales: Follow smart money movements",
-            "⏰ Time Limits: 4-hour session maximum",
-            "📱 Stay Alert: Evening can be volatile",
-            "💎 Moon Bags: Let 20% ride for potential 5-10x"
-        ]
+        return _TIPS
     
     def get_session_summary(self) -> Dict[str, Any]:
         """Get current session summary"""
@@ -193,7 +436,7 @@ class EveningTradingStrategy:
             if not self.session_stats['session_start']:
                 return {'status': 'No active session'}
             
-            session_duration = datetime.utcnow() - self.session_stats['session_start']
+            session_minutes = (time.monotonic_ns() - self._session_start_ns) / 6e10
             
             # Calculate win rate
             win_rate = 0.0
@@ -201,14 +444,14 @@ class EveningTradingStrategy:
                 win_rate = self.session_stats['successful_trades'] / self.session_stats['trades_executed'] * 100
             
             return {
-                'session_duration_minutes': session_duration.total_seconds() / 60,
+                'session_duration_minutes': session_minutes,
                 'trades_executed': self.session_stats['trades_executed'],
                 'successful_trades': self.session_stats['successful_trades'],
                 'win_rate_percent': win_rate,
                 'total_pnl': self.session_stats['total_pnl'],
-                'active_positions': len(self.active_positions),
-                'remaining_capacity': self.session_config['max_trades'] - len(self.active_positions),
-                'session_config': self.session_config
+                'active_positions': len(self.mint_index),
+                'remaining_capacity': self.session_config.max_trades - len(self.mint_index),
+                'session_config': asdict(self.session_config)
             }
             
         except Exception as e:
@@ -217,78 +460,7 @@ class EveningTradingStrategy:
 
 def print_evening_trading_guide():
     """Print comprehensive evening trading guide"""
-    print("🌙 EVENING TRADING STRATEGY GUIDE")
-    print("=" * 50)
-    print()
-    
-    print("⏰ OPTIMAL TIMING:")
-    print("• 6:00-7:00 PM: Setup and scanning phase")
-    print("• 7:00-9:00 PM: Prime retail activity window")
-    print("• 9:00-11:00 PM: Whale activity increases")
-    print("• 11:00 PM+: Late night pumps (higher risk)")
-    print()
-    
-    print("💰 POSITION SIZING:")
-    print("• Conservative: 1.5% per trade, max 2 positions")
-    print("• Moderate: 2% per trade, max 3 positions")
-    print("• Aggressive: 3% per trade, max 5 positions")
-    print()
-    
-    print("🎯 ENTRY CRITERIA:")
-    print("• Overall score: 7.5+ out of 10")
-    print("• Risk level: Low to Medium only")
-    print("• Developer risk: Below 3.0")
-    print("• Liquidity quality: Good or Excellent")
-    print("• Whale sentiment: Neutral to Bullish")
-    print()
-    
-    print("🛑 EXIT STRATEGY:")
-    print("• Stop Loss: 15% (tight for evening volatility)")
-    print("• Take Profit 1: 25% (sell 50% of position)")
-    print("• Take Profit 2: 50% (sell additional 30%)")
-    print("• Moon Bag: Keep 20% for potential 5-10x")
-    print()
-    
-    print("⚠️ RISK MANAGEMENT:")
-    print("• Maximum 3 simultaneous positions")
-    print("• Session limit: 4 hours maximum")
-    print("• Daily loss limit: 6% of account")
-    print("• Trailing stops: 10% when in 10%+ profit")
-    print()
-    
-    print("🔍 WHAT TO LOOK FOR TONIGHT:")
-    print("• New tokens with strong fundamentals")
-    print("• Bonding curve progress: 10-70%")
-    print("• Active developer engagement")
-    print("• Growing community metrics")
-    print("• Whale accumulation patterns")
-    print()
-    
-    print("🚫 RED FLAGS TO AVOID:")
-    print("• Copy-paste projects")
-    print("• Anonymous developers")
-    print("• Suspicious funding patterns")
-    print("• Poor liquidity conditions")
-    print("• Late-stage bonding curve (>90%)")
-    print()
-    
-    print("📊 SUCCESS METRICS:")
-    print("• Win rate target: 60%+")
-    print("• Average return per trade: 30%+")
-    print("• Maximum drawdown: <10%")
-    print("• Risk-adjusted returns: Positive Sharpe ratio")
-    print()
-    
-    print("💡 PRO TIPS:")
-    print("• Start small to test the enhanced system")
-    print("• Use the opportunity scanner for real-time alerts")
-    print("• Follow whale wallets for early signals")
-    print("• Take profits systematically - don't get greedy")
-    print("• Keep detailed records for continuous improvement")
-    print()
-    
-    print("⚠️ DISCLAIMER: This is educational content only.")
-    print("Always do your own research and never invest more than you can afford to lose!")
+    sys.stdout.write(_GUIDE)
 
 # Example usage
 if __name__ == "__main__":
@@ -2,21 +2,95 @@
 Execution Engine - Handles trade execution with risk controls and multi-wallet support
 """
 import asyncio
+import itertools
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import os
+from typing import Dict, List, Optional, Any, Tuple, Deque
+from collections import deque
 from datetime import datetime, timedelta
 from enum import Enum
 import json
+import random
+import time
 import uuid
 
 from ..data.pumpportal_client import PumpPortalClient
 from ..wallets.wallet_manager import WalletManager, SolanaWallet
-from ..trading.strategy_engine import TradingSignal, StrategyType
+from ..trading.strategy_engine import TradingSignal, StrategyType, SignalStrength
 from ..trading.risk_manager import RiskManager, Position, RiskLevel
 from ..config.settings import settings
+from ..utils.async_helpers import fast_to_thread
 
 logger = logging.getLogger(__name__)
 
+# Full-jitter retry backoff (seconds)
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_CAP = 30.0
+
+# Per-attempt PumpPortal timeout and overall budget per execution (seconds)
+TRADE_TIMEOUT_S = getattr(settings, 'TRADE_TIMEOUT_S', 5.0)
+EXECUTION_DEADLINE_S = getattr(settings, 'EXECUTION_DEADLINE_S', 30.0)
+
+# Worker tasks draining the queue, and trades dispatched at once; workers outnumber the
+# in-flight slots so those sleeping through a retry backoff don't leave a slot idle
+EXECUTION_WORKERS = getattr(settings, 'EXECUTION_WORKERS', 8)
+MAX_INFLIGHT_TRADES = min(getattr(settings, 'MAX_INFLIGHT_TRADES', 4), EXECUTION_WORKERS)
+
+# How long a fetched wallet balance is reused (seconds)
+BALANCE_CACHE_TTL_S = 0.5
+
+# Append-only JSONL log of finished executions, written in batches
+EXECUTION_LOG_PATH = getattr(settings, 'EXECUTION_LOG_PATH', os.path.join('logs', 'executions.jsonl'))
+AUDIT_BATCH_SIZE = 100
+AUDIT_FLUSH_INTERVAL_S = 1.0
+
+# Queued entries/retries beyond this are rejected instead of executed late; exits are always queued
+MAX_QUEUE_DEPTH = getattr(settings, 'MAX_QUEUE_DEPTH', 1_000)
+
+# Error fragments that retrying cannot fix
+UNRECOVERABLE_ERRORS = (
+    "insufficient",
+    "invalid mint",
+    "invalid token",
+    "mint not found",
+    "token not found",
+    "invalid amount",
+    "unauthorized",
+    "forbidden",
+)
+
+def is_recoverable_error(error_message: Optional[str]) -> bool:
+    """Check whether a failed execution is worth retrying (rate limits, 5xx, timeouts)"""
+    if not error_message:
+        return True
+    
+    message = error_message.lower()
+    return not any(fragment in message for fragment in UNRECOVERABLE_ERRORS)
+
+class TokenBucket:
+    """Simple async token-bucket rate limiter"""
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a token is available and consume it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                
+                await asyncio.sleep((1.0 - self.tokens) / self.rate)
+
 class ExecutionStatus(Enum):
     """Execution status for trades"""
     PENDING = "pending"
@@ -33,9 +107,29 @@ class OrderType(Enum):
     STOP_LOSS = "stop_loss"
     TAKE_PROFIT = "take_profit"
 
+TERMINAL_STATUSES = frozenset({
+    ExecutionStatus.COMPLETED,
+    ExecutionStatus.FAILED,
+    ExecutionStatus.CANCELLED,
+})
+
+# Queue priorities: stop losses drain first, then take profits, then everything else
+ORDER_PRIORITIES = {
+    OrderType.STOP_LOSS: 0,
+    OrderType.TAKE_PROFIT: 1,
+}
+DEFAULT_ORDER_PRIORITY = 2
+
 class TradeExecution:
     """Represents a trade execution"""
     
+    __slots__ = (
+        'execution_id', 'signal', 'wallet', 'order_type', 'amount', 'expected_price',
+        'status', 'created_at', 'executed_at', 'actual_price', 'actual_amount',
+        'transaction_signature', 'gas_fee', 'slippage', 'error_message',
+        'retry_count', 'max_retries', '_cached_dict', '_created_mono'
+    )
+    
     def __init__(self, 
                  execution_id: str,
                  signal: TradingSignal,
@@ -51,6 +145,7 @@ class TradeExecution:
         self.expected_price = expected_price
         self.status = ExecutionStatus.PENDING
         self.created_at = datetime.utcnow()
+        self._created_mono = time.monotonic()  # Deadline base, immune to wall-clock jumps
         self.executed_at = None
         self.actual_price = 0.0
         self.actual_amount = 0.0
@@ -60,10 +155,15 @@ class TradeExecution:
         self.error_message = None
         self.retry_count = 0
         self.max_retries = 3
+        self._cached_dict: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert execution to dictionary"""
-        return {
+        """Convert execution to dictionary (cached once the execution is terminal)"""
+        terminal = self.status in TERMINAL_STATUSES
+        if terminal and self._cached_dict is not None:
+            return self._cached_dict
+        
+        result = {
             'execution_id': self.execution_id,
             'signal_id': self.signal.signal_id,
             'wallet_id': self.wallet.wallet_id,
@@ -81,18 +181,78 @@ class TradeExecution:
             'error_message': self.error_message,
             'retry_count': self.retry_count
         }
+        self._cached_dict = result if terminal else None
+        return result
+
+_BUY_PARAMS = {
+    "action": "buy",
+    "denominatedInSol": True,
+    "slippage": 1.0,  # 1% slippage tolerance
+    "priorityFee": 0.0001,  # Priority fee for faster execution
+    "pool": "pump"
+}
+
+_SELL_PARAMS = {
+    "action": "sell",
+    "denominatedInSol": False,  # Selling tokens, not SOL
+    "slippage": 1.0,
+    "priorityFee": 0.0001,
+    "pool": "pump"
+}
 
 class ExecutionEngine:
     """Handles trade execution with risk controls"""
     
+    # PumpPortal parameters per order type; mint and amount are filled in per trade
+    _TRADE_PARAM_TEMPLATES = {
+        OrderType.MARKET_BUY: _BUY_PARAMS,
+        OrderType.MARKET_SELL: _SELL_PARAMS,
+        OrderType.STOP_LOSS: _SELL_PARAMS,
+        OrderType.TAKE_PROFIT: _SELL_PARAMS,
+    }
+    
     def __init__(self, wallet_manager: WalletManager, risk_manager: RiskManager):
         self.wallet_manager = wallet_manager
         self.risk_manager = risk_manager
         self.pumpportal_client = None
         self.pending_executions: Dict[str, TradeExecution] = {}
-        self.completed_executions: List[TradeExecution] = []
-        self.execution_queue = asyncio.Queue()
+        self.completed_executions: Deque[TradeExecution] = deque(maxlen=getattr(settings, 'MAX_HISTORY', 1_000))
+        self._completed_index: Dict[str, TradeExecution] = {}
+        
+        # Running aggregates over all completed executions
+        self._agg_completed = 0
+        self._agg_success = 0
+        self._agg_failed = 0
+        self._agg_volume = 0.0
+        self._slip_n = 0
+        self._slip_mean = 0.0  # Welford running mean of slippage
+        
+        # Entries are (priority, sequence, execution); sequence keeps FIFO within a priority
+        # Unbounded so exits never wait; _enqueue_nowait applies MAX_QUEUE_DEPTH to everything else
+        self.execution_queue = asyncio.PriorityQueue()
+        self._queue_full = 0
+        self._seq = itertools.count()
+        self._completion_waiters: Dict[str, asyncio.Future] = {}
+        self._audit_queue: asyncio.Queue = asyncio.Queue()
+        self.audit_task: Optional[asyncio.Task] = None
         self.is_running = False
+        self._wallets_by_id: Dict[str, SolanaWallet] = {}
+        self._bal_cache: Dict[str, Tuple[float, float]] = {}  # wallet_id -> (balance, monotonic deadline)
+        
+        # Push-driven position monitoring
+        self._price_bus: Dict[str, asyncio.Event] = {}
+        self._latest_prices: Dict[str, float] = {}
+        self._positions_by_mint: Dict[str, List[str]] = {}
+        self._mint_watchers: Dict[str, asyncio.Task] = {}
+        self._closing_positions = set()
+        
+        # Worker pool, in-flight limit and per-endpoint rate limits
+        self.workers: List[asyncio.Task] = []
+        self.monitoring_task: Optional[asyncio.Task] = None
+        self._inflight = asyncio.Semaphore(MAX_INFLIGHT_TRADES)
+        self._rate_limiters: Dict[str, TokenBucket] = {
+            'trade': TokenBucket(getattr(settings, 'PUMPPORTAL_TRADES_PER_SECOND', 10.0))
+        }
         
     async def initialize(self):
         """Initialize execution engine"""
@@ -103,15 +263,19 @@ class ExecutionEngine:
             self.pumpportal_client = PumpPortalClient()
             await self.pumpportal_client.__aenter__()
             
-            # Start execution worker
+            # Start execution workers
             self.is_running = True
-            asyncio.create_task(self._execution_worker())
-            asyncio.create_task(self._monitoring_worker())
+            self.workers = [
+                asyncio.create_task(self._execution_worker())
+                for _ in range(EXECUTION_WORKERS)
+            ]
+            self.monitoring_task = asyncio.create_task(self._monitoring_worker())
+            self.audit_task = asyncio.create_task(self._audit_writer())
             
             logger.info("Execution engine initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize execution engine: {str(e)}")
+            logger.error("Failed to initialize execution engine: %s", e)
             raise
     
     async def execute_signal(self, signal: TradingSignal) -> Optional[str]:
@@ -125,7 +289,7 @@ class ExecutionEngine:
             Execution ID if successful, None otherwise
         """
         try:
-            logger.info(f"Executing signal: {signal.signal_id}")
+            logger.info("Executing signal: %s", signal.signal_id)
             
             # Get appropriate wallet
             wallet = await self.wallet_manager.get_wallet_for_strategy(
@@ -134,24 +298,28 @@ class ExecutionEngine:
             )
             
             if not wallet:
-                logger.error(f"No suitable wallet found for signal {signal.signal_id}")
+                logger.error("No suitable wallet found for signal %s", signal.signal_id)
                 return None
             
             # Get wallet balance
-            wallet_balance = await self.wallet_manager.get_wallet_balance(wallet.wallet_id)
+            wallet_balance = await self._get_wallet_balance(wallet.wallet_id)
             
             # Evaluate risk
             risk_evaluation = await self.risk_manager.evaluate_signal_risk(signal, wallet_balance)
             
             if not risk_evaluation['approved']:
-                logger.warning(f"Signal {signal.signal_id} rejected by risk manager: {risk_evaluation['blocking_factors']}")
+                logger.warning("Signal %s rejected by risk manager: %s", signal.signal_id, risk_evaluation['blocking_factors'])
                 return None
             
             # Use risk-adjusted amount
             execution_amount = risk_evaluation['recommended_amount']
             
+            if execution_amount <= 0 or not signal.mint_address:
+                logger.warning("Signal %s has no tradable amount or mint, skipping", signal.signal_id)
+                return None
+            
             # Create execution
-            execution_id = f"exec_{signal.signal_id}_{int(datetime.utcnow().timestamp())}"
+            execution_id = f"exec_{signal.signal_id}_{time.time_ns()}"
             execution = TradeExecution(
                 execution_id=execution_id,
                 signal=signal,
@@ -160,17 +328,22 @@ class ExecutionEngine:
                 amount=execution_amount
             )
             
+            # Queue for execution, failing fast when the workers are saturated
+            try:
+                self._enqueue_nowait(execution)
+            except asyncio.QueueFull:
+                self._queue_full += 1
+                logger.warning("Execution queue full, dropping signal %s", signal.signal_id)
+                return None
+            
             # Add to pending executions
             self.pending_executions[execution_id] = execution
             
-            # Queue for execution
-            await self.execution_queue.put(execution)
-            
-            logger.info(f"Queued execution {execution_id} for signal {signal.signal_id}")
+            logger.info("Queued execution %s for signal %s", execution_id, signal.signal_id)
             return execution_id
             
         except Exception as e:
-            logger.error(f"Error executing signal: {str(e)}")
+            logger.error("Error executing signal: %s", e)
             return None
     
     async def _execution_worker(self):
@@ -179,7 +352,7 @@ class ExecutionEngine:
             while self.is_running:
                 try:
                     # Get next execution from queue
-                    execution = await asyncio.wait_for(self.execution_queue.get(), timeout=1.0)
+                    _, _, execution = await asyncio.wait_for(self.execution_queue.get(), timeout=1.0)
                     
                     # Process the execution
                     await self._process_execution(execution)
@@ -187,27 +360,41 @@ class ExecutionEngine:
                 except asyncio.TimeoutError:
                     continue
                 except Exception as e:
-                    logger.error(f"Error in execution worker: {str(e)}")
+                    logger.error("Error in execution worker: %s", e)
                     await asyncio.sleep(1)
                     
         except asyncio.CancelledError:
             logger.info("Execution worker cancelled")
         except Exception as e:
-            logger.error(f"Fatal error in execution worker: {str(e)}")
+            logger.error("Fatal error in execution worker: %s", e)
     
     async def _process_execution(self, execution: TradeExecution):
         """Process a single trade execution"""
         try:
+            # Cancelled while queued - skip the network round trip
+            if execution.status == ExecutionStatus.CANCELLED:
+                self._archive_execution(execution)
+                return
+            
+            # Invalid parameters would only fail remotely and burn the retry budget
+            if execution.amount <= 0 or not execution.signal.mint_address or execution.expected_price < 0:
+                execution.status = ExecutionStatus.FAILED
+                execution.error_message = "Invalid execution parameters"
+                logger.error("Execution %s has invalid parameters, not submitting", execution.execution_id)
+                self._archive_execution(execution)
+                return
+            
             execution.status = ExecutionStatus.EXECUTING
-            logger.info(f"Processing execution {execution.execution_id}")
+            logger.info("Processing execution %s", execution.execution_id)
             
-            if execution.order_type == OrderType.MARKET_BUY:
-                success = await self._execute_market_buy(execution)
-            elif execution.order_type == OrderType.MARKET_SELL:
-                success = await self._execute_market_sell(execution)
-            else:
-                logger.error(f"Unsupported order type: {execution.order_type}")
-                success = False
+            # Limit trades in flight; retry backoff below runs outside the semaphore
+            async with self._inflight:
+                template = self._TRADE_PARAM_TEMPLATES.get(execution.order_type)
+                if template:
+                    success = await self._execute_trade(execution, template)
+                else:
+                    logger.error("Unsupported order type: %s", execution.order_type)
+                    success = False
             
             if success:
                 execution.status = ExecutionStatus.COMPLETED
@@ -217,93 +404,122 @@ class ExecutionEngine:
                 if execution.order_type == OrderType.MARKET_BUY:
                     await self._create_position_from_execution(execution)
                 
-                # Update wallet usage
+                # Update wallet usage; the cached balance is now stale
                 execution.wallet.update_usage(execution.actual_amount * execution.actual_price)
+                self._bal_cache.pop(execution.wallet.wallet_id, None)
                 
-                logger.info(f"Execution {execution.execution_id} completed successfully")
+                logger.info("Execution %s completed successfully", execution.execution_id)
                 
             else:
                 # Handle failure
                 execution.retry_count += 1
                 
-                if execution.retry_count < execution.max_retries:
-                    logger.warning(f"Execution {execution.execution_id} failed, retrying ({execution.retry_count}/{execution.max_retries})")
+                elapsed = time.monotonic() - execution._created_mono
+                
+                if not is_recoverable_error(execution.error_message):
+                    execution.status = ExecutionStatus.FAILED
+                    logger.error("Execution %s failed with unrecoverable error: %s", execution.execution_id, execution.error_message)
+                elif elapsed >= EXECUTION_DEADLINE_S:
+                    execution.status = ExecutionStatus.FAILED
+                    logger.error("Execution %s failed: exceeded %ss deadline", execution.execution_id, EXECUTION_DEADLINE_S)
+                elif execution.retry_count < execution.max_retries:
+                    logger.warning("Execution %s failed, retrying (%s/%s)", execution.execution_id, execution.retry_count, execution.max_retries)
                     execution.status = ExecutionStatus.PENDING
                     
-                    # Add delay before retry
-                    await asyncio.sleep(2 ** execution.retry_count)  # Exponential backoff
-                    await self.execution_queue.put(execution)
+                    # Full-jitter exponential backoff so concurrent retries don't synchronize
+                    delay = random.uniform(0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * (2 ** execution.retry_count)))
+                    await asyncio.sleep(delay)
+                    
+                    # Never block a worker on its own queue
+                    try:
+                        self._enqueue_nowait(execution)
+                    except asyncio.QueueFull:
+                        self._queue_full += 1
+                        execution.status = ExecutionStatus.FAILED
+                        execution.error_message = "Execution queue full"
+                        logger.error("Execution %s failed: queue full on retry", execution.execution_id)
                 else:
                     execution.status = ExecutionStatus.FAILED
-                    logger.error(f"Execution {execution.execution_id} failed after {execution.max_retries} retries")
+                    logger.error("Execution %s failed after %s retries", execution.execution_id, execution.max_retries)
             
             # Move to completed executions if done
-            if execution.status in [ExecutionStatus.COMPLETED, ExecutionStatus.FAILED, ExecutionStatus.CANCELLED]:
-                self.completed_executions.append(execution)
-                if execution.execution_id in self.pending_executions:
-                    del self.pending_executions[execution.execution_id]
+            if execution.status in TERMINAL_STATUSES:
+                self._archive_execution(execution)
             
         except Exception as e:
-            logger.error(f"Error processing execution {execution.execution_id}: {str(e)}")
+            logger.error("Error processing execution %s: %s", execution.execution_id, e)
             execution.status = ExecutionStatus.FAILED
             execution.error_message = str(e)
+            self._archive_execution(execution)
     
-    async def _execute_market_buy(self, execution: TradeExecution) -> bool:
-        """Execute a market buy order"""
-        try:
-            # Prepare trade parameters
-            trade_params = {
-                "action": "buy",
-                "mint": execution.signal.mint_address,
-                "amount": execution.amount,
-                "denominatedInSol": True,
-                "slippage": 1.0,  # 1% slippage tolerance
-                "priorityFee": 0.0001,  # Priority fee for faster execution
-                "pool": "pump"
-            }
-            
-            # Execute trade through PumpPortal
-            result = await self.pumpportal_client.execute_trade(trade_params)
-            
-            if result['success']:
-                # Parse execution results
-                execution.transaction_signature = result['data'].get('signature', '')
-                execution.actual_price = result['data'].get('price', 0.0)
-                execution.actual_amount = result['data'].get('amount', 0.0)
-                execution.gas_fee = result['data'].get('fee', 0.0)
-                
-                # Calculate slippage
-                if execution.expected_price > 0:
-                    execution.slippage = abs(execution.actual_price - execution.expected_price) / execution.expected_price * 100
-                
-                logger.info(f"Market buy executed: {execution.actual_amount} tokens at {execution.actual_price}")
-                return True
-            else:
-                execution.error_message = result.get('error', 'Unknown error')
-                logger.error(f"Market buy failed: {execution.error_message}")
-                return False
-                
-        except Exception as e:
-            execution.error_message = str(e)
-            logger.error(f"Error executing market buy: {str(e)}")
-            return False
+    def _enqueue_nowait(self, execution: TradeExecution):
+        """Queue an execution by order type priority; raises asyncio.QueueFull for a non-exit order at capacity"""
+        priority = ORDER_PRIORITIES.get(execution.order_type)
+        if priority is None:
+            if self.execution_queue.qsize() >= MAX_QUEUE_DEPTH:
+                raise asyncio.QueueFull
+            priority = DEFAULT_ORDER_PRIORITY
+        self.execution_queue.put_nowait((priority, next(self._seq), execution))
     
-    async def _execute_market_sell(self, execution: TradeExecution) -> bool:
-        """Execute a market sell order"""
+    async def _submit_and_wait(self, execution: TradeExecution) -> bool:
+        """Queue an execution and wait until it reaches a terminal status"""
+        waiter = asyncio.get_running_loop().create_future()
+        self._completion_waiters[execution.execution_id] = waiter
+        self.pending_executions[execution.execution_id] = execution
+        
+        # Stop loss/take profit bypass the depth limit, so this never waits behind queued buys
+        self._enqueue_nowait(execution)
+        await waiter
+        
+        return execution.status == ExecutionStatus.COMPLETED
+    
+    def _archive_execution(self, execution: TradeExecution):
+        """Move a finished execution into history and update the running aggregates"""
+        # Aggregates must count each execution exactly once
+        if execution.execution_id in self._completed_index:
+            return
+        
+        if len(self.completed_executions) == self.completed_executions.maxlen:
+            evicted = self.completed_executions[0]
+            self._completed_index.pop(evicted.execution_id, None)
+        
+        self.completed_executions.append(execution)
+        self._completed_index[execution.execution_id] = execution
+        self.pending_executions.pop(execution.execution_id, None)
+        
+        self._agg_completed += 1
+        if execution.status == ExecutionStatus.COMPLETED:
+            self._agg_success += 1
+            self._agg_volume += execution.actual_amount * execution.actual_price
+            self._slip_n += 1
+            self._slip_mean += (execution.slippage - self._slip_mean) / self._slip_n
+        elif execution.status == ExecutionStatus.FAILED:
+            self._agg_failed += 1
+        
+        waiter = self._completion_waiters.pop(execution.execution_id, None)
+        if waiter and not waiter.done():
+            waiter.set_result(execution.status)
+        
+        self._audit_queue.put_nowait(execution.to_dict())
+    
+    async def _execute_trade(self, execution: TradeExecution, template: Dict[str, Any]) -> bool:
+        """Execute a market order built from a trade parameter template"""
+        side = template["action"]
+        
         try:
             # Prepare trade parameters
             trade_params = {
-                "action": "sell",
+                **template,
                 "mint": execution.signal.mint_address,
-                "amount": execution.amount,
-                "denominatedInSol": False,  # Selling tokens, not SOL
-                "slippage": 1.0,
-                "priorityFee": 0.0001,
-                "pool": "pump"
+                "amount": execution.amount
             }
             
             # Execute trade through PumpPortal
-            result = await self.pumpportal_client.execute_trade(trade_params)
+            await self._rate_limiters['trade'].acquire()
+            result = await asyncio.wait_for(
+                self.pumpportal_client.execute_trade(trade_params),
+                timeout=TRADE_TIMEOUT_S
+            )
             
             if result['success']:
                 # Parse execution results
@@ -316,22 +532,26 @@ class ExecutionEngine:
                 if execution.expected_price > 0:
                     execution.slippage = abs(execution.actual_price - execution.expected_price) / execution.expected_price * 100
                 
-                logger.info(f"Market sell executed: {execution.actual_amount} tokens at {execution.actual_price}")
+                logger.info("Market %s executed: %s tokens at %s", side, execution.actual_amount, execution.actual_price)
                 return True
             else:
                 execution.error_message = result.get('error', 'Unknown error')
-                logger.error(f"Market sell failed: {execution.error_message}")
+                logger.error("Market %s failed: %s", side, execution.error_message)
                 return False
                 
+        except asyncio.TimeoutError:
+            execution.error_message = f"Trade request timed out after {TRADE_TIMEOUT_S}s"
+            logger.error("Market %s timed out for execution %s", side, execution.execution_id)
+            return False
         except Exception as e:
             execution.error_message = str(e)
-            logger.error(f"Error executing market sell: {str(e)}")
+            logger.error("Error executing market %s: %s", side, e)
             return False
     
     async def _create_position_from_execution(self, execution: TradeExecution):
         """Create a position in risk manager from successful execution"""
         try:
-            position_id = f"pos_{execution.signal.mint_address}_{execution.wallet.wallet_id}_{int(datetime.utcnow().timestamp())}"
+            position_id = f"pos_{execution.signal.mint_address}_{execution.wallet.wallet_id}_{time.time_ns()}"
             
             position = Position(
                 position_id=position_id,
@@ -348,10 +568,72 @@ class ExecutionEngine:
             )
             
             await self.risk_manager.add_position(position)
-            logger.info(f"Created position {position_id} from execution {execution.execution_id}")
+            self._sync_mint_watchers()
+            logger.info("Created position %s from execution %s", position_id, execution.execution_id)
             
         except Exception as e:
-            logger.error(f"Error creating position from execution: {str(e)}")
+            logger.error("Error creating position from execution: %s", e)
+    
+    async def _audit_writer(self):
+        """Background worker appending finished executions to the JSONL audit log"""
+        loop = asyncio.get_running_loop()
+        
+        try:
+            stopping = False
+            while not stopping:
+                # Wait for a first record, then batch up to AUDIT_BATCH_SIZE or AUDIT_FLUSH_INTERVAL_S
+                batch = [await self._audit_queue.get()]
+                deadline = loop.time() + AUDIT_FLUSH_INTERVAL_S
+                while len(batch) < AUDIT_BATCH_SIZE and batch[-1] is not None:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._audit_queue.get(), timeout=timeout))
+                    except asyncio.TimeoutError:
+                        break
+                
+                # None is the shutdown sentinel queued by cleanup()
+                if batch[-1] is None:
+                    stopping = True
+                    batch.pop()
+                
+                if batch:
+                    try:
+                        await fast_to_thread(self._write_audit_batch, batch)
+                    except Exception as e:
+                        logger.error("Error writing execution audit log: %s", e)
+                        
+        except asyncio.CancelledError:
+            logger.info("Audit writer cancelled")
+    
+    @staticmethod
+    def _write_audit_batch(records: List[Dict[str, Any]]):
+        """Append a batch of execution records to the audit log"""
+        directory = os.path.dirname(EXECUTION_LOG_PATH)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        with open(EXECUTION_LOG_PATH, 'a', encoding='utf-8') as log_file:
+            log_file.write(''.join(json.dumps(record) + '\n' for record in records))
+    
+    async def _get_wallet_balance(self, wallet_id: str) -> float:
+        """Get a wallet balance, reusing a recent read for bursts of signals"""
+        cached = self._bal_cache.get(wallet_id)
+        if cached and time.monotonic() < cached[1]:
+            return cached[0]
+        
+        balance = await self.wallet_manager.get_wallet_balance(wallet_id)
+        self._bal_cache[wallet_id] = (balance, time.monotonic() + BALANCE_CACHE_TTL_S)
+        return balance
+    
+    def _get_wallet(self, wallet_id: str) -> Optional[SolanaWallet]:
+        """Look up a wallet by id, reindexing the wallet manager's wallets on a miss"""
+        wallet = self._wallets_by_id.get(wallet_id)
+        if wallet is None:
+            self._wallets_by_id = {w.wallet_id: w for w in self.wallet_manager.wallets.values()}
+            wallet = self._wallets_by_id.get(wallet_id)
+        return wallet
     
     async def execute_stop_loss(self, position_id: str) -> bool:
         """Execute stop loss for a position"""
@@ -359,25 +641,20 @@ class ExecutionEngine:
             # Get position from risk manager
             position = self.risk_manager.positions.get(position_id)
             if not position:
-                logger.error(f"Position not found for stop loss: {position_id}")
+                logger.error("Position not found for stop loss: %s", position_id)
                 return False
             
             # Get wallet
-            wallet = None
-            for w in self.wallet_manager.wallets.values():
-                if w.wallet_id == position.wallet_id:
-                    wallet = w
-                    break
+            wallet = self._get_wallet(position.wallet_id)
             
             if not wallet:
-                logger.error(f"Wallet not found for stop loss: {position.wallet_id}")
+                logger.error("Wallet not found for stop loss: %s", position.wallet_id)
                 return False
             
             # Create sell execution
-            execution_id = f"sl_{position_id}_{int(datetime.utcnow().timestamp())}"
+            execution_id = f"sl_{position_id}_{time.time_ns()}"
             
             # Create a dummy signal for the stop loss
-            from ..trading.strategy_engine import TradingSignal, SignalStrength
             stop_loss_signal = TradingSignal(
                 mint_address=position.mint_address,
                 strategy_type=position.strategy_type,
@@ -398,8 +675,8 @@ class ExecutionEngine:
                 expected_price=position.current_price
             )
             
-            # Execute immediately (high priority)
-            success = await self._execute_market_sell(execution)
+            # Queue ahead of regular orders and wait for the result
+            success = await self._submit_and_wait(execution)
             
             if success:
                 # Close position in risk manager
@@ -409,14 +686,14 @@ class ExecutionEngine:
                     execution.actual_amount
                 )
                 
-                logger.info(f"Stop loss executed for position {position_id}")
+                logger.info("Stop loss executed for position %s", position_id)
                 return True
             else:
-                logger.error(f"Stop loss execution failed for position {position_id}")
+                logger.error("Stop loss execution failed for position %s", position_id)
                 return False
                 
         except Exception as e:
-            logger.error(f"Error executing stop loss: {str(e)}")
+            logger.error("Error executing stop loss: %s", e)
             return False
     
     async def execute_take_profit(self, position_id: str, percentage: float = 0.5) -> bool:
@@ -425,28 +702,23 @@ class ExecutionEngine:
             # Get position from risk manager
             position = self.risk_manager.positions.get(position_id)
             if not position:
-                logger.error(f"Position not found for take profit: {position_id}")
+                logger.error("Position not found for take profit: %s", position_id)
                 return False
             
             # Calculate amount to sell
             sell_amount = position.current_amount * percentage
             
             # Get wallet
-            wallet = None
-            for w in self.wallet_manager.wallets.values():
-                if w.wallet_id == position.wallet_id:
-                    wallet = w
-                    break
+            wallet = self._get_wallet(position.wallet_id)
             
             if not wallet:
-                logger.error(f"Wallet not found for take profit: {position.wallet_id}")
+                logger.error("Wallet not found for take profit: %s", position.wallet_id)
                 return False
             
             # Create sell execution
-            execution_id = f"tp_{position_id}_{int(datetime.utcnow().timestamp())}"
+            execution_id = f"tp_{position_id}_{time.time_ns()}"
             
             # Create a dummy signal for the take profit
-            from ..trading.strategy_engine import TradingSignal, SignalStrength
             take_profit_signal = TradingSignal(
                 mint_address=position.mint_address,
                 strategy_type=position.strategy_type,
@@ -467,8 +739,8 @@ class ExecutionEngine:
                 expected_price=position.current_price
             )
             
-            # Execute immediately (high priority)
-            success = await self._execute_market_sell(execution)
+            # Queue ahead of regular orders and wait for the result
+            success = await self._submit_and_wait(execution)
             
             if success:
                 # Partially close position in risk manager
@@ -478,14 +750,14 @@ class ExecutionEngine:
                     execution.actual_amount
                 )
                 
-                logger.info(f"Take profit executed for position {position_id}: {percentage*100:.0f}%")
+                logger.info("Take profit executed for position %s: %.0f%%", position_id, percentage*100)
                 return True
             else:
-                logger.error(f"Take profit execution failed for position {position_id}")
+                logger.error("Take profit execution failed for position %s", position_id)
                 return False
                 
         except Exception as e:
-            logger.error(f"Error executing take profit: {str(e)}")
+            logger.error("Error executing take profit: %s", e)
             return False
     
     async def _monitoring_worker(self):
@@ -493,33 +765,130 @@ class ExecutionEngine:
         try:
             while self.is_running:
                 try:
-                    # Check all positions for stop loss and take profit triggers
-                    for position_id, position in self.risk_manager.positions.items():
-                        # Update position price (this would come from real-time data)
-                        # For now, we'll skip this as it requires price feed integration
-                        
-                        # Check for risk alerts
-                        alerts = await self.risk_manager.update_position_price(position_id, position.current_price)
-                        
-                        if alerts:
-                            for alert in alerts:
-                                if alert.alert_type.value == "position_stop_loss":
-                                    logger.warning(f"Stop loss triggered for {position_id}")
-                                    await self.execute_stop_loss(position_id)
-                                elif alert.alert_type.value == "position_take_profit":
-                                    logger.info(f"Take profit triggered for {position_id}")
-                                    await self.execute_take_profit(position_id, 0.5)  # Sell 50%
+                    # Price pushes are handled by per-mint watchers; this sweep is the fallback
+                    self._sync_mint_watchers()
+                    await self._check_positions()
                     
-                    await asyncio.sleep(10)  # Check every 10 seconds
+                    await asyncio.sleep(10)  # Sweep every 10 seconds
                     
                 except Exception as e:
-                    logger.error(f"Error in monitoring worker: {str(e)}")
+                    logger.error("Error in monitoring worker: %s", e)
                     await asyncio.sleep(5)
                     
         except asyncio.CancelledError:
             logger.info("Monitoring worker cancelled")
         except Exception as e:
-            logger.error(f"Fatal error in monitoring worker: {str(e)}")
+            logger.error("Fatal error in monitoring worker: %s", e)
+    
+    def publish_prices(self, prices: Dict[str, float]):
+        """
+        Feed {mint: price} ticks, waking only the watchers of held mints.
+        
+        This is the entry point for a live price feed: the PumpPortal websocket consumer should call it
+        for each trade/price message. Until a feed is attached, positions are checked by the
+        10 second sweep in _monitoring_worker. Prices for mints without an open position are dropped.
+        """
+        price_bus = self._price_bus
+        for mint_address, price in prices.items():
+            event = price_bus.get(mint_address)
+            if event:
+                self._latest_prices[mint_address] = price
+                event.set()
+    
+    def _sync_mint_watchers(self):
+        """Index open positions by mint and keep one watcher task per held mint"""
+        positions_by_mint: Dict[str, List[str]] = {}
+        for position_id, position in self.risk_manager.positions.items():
+            positions_by_mint.setdefault(position.mint_address, []).append(position_id)
+        self._positions_by_mint = positions_by_mint
+        
+        for mint_address in list(self._mint_watchers):
+            if mint_address not in positions_by_mint:
+                self._mint_watchers.pop(mint_address).cancel()
+                self._price_bus.pop(mint_address, None)
+                self._latest_prices.pop(mint_address, None)
+        
+        for mint_address in positions_by_mint:
+            if mint_address not in self._mint_watchers:
+                self._price_bus[mint_address] = asyncio.Event()
+                self._mint_watchers[mint_address] = asyncio.create_task(self._mint_watcher(mint_address))
+    
+    async def _mint_watcher(self, mint_address: str):
+        """Check a mint's positions whenever a new price for it is published"""
+        event = self._price_bus[mint_address]
+        
+        try:
+            while self.is_running:
+                await event.wait()
+                event.clear()
+                
+                try:
+                    price = self._latest_prices[mint_address]
+                    position_ids = [
+                        position_id for position_id in self._positions_by_mint.get(mint_address, [])
+                        if position_id in self.risk_manager.positions
+                    ]
+                    alert_results = await asyncio.gather(*[
+                        self.risk_manager.update_position_price(position_id, price)
+                        for position_id in position_ids
+                    ])
+                    await asyncio.gather(*[
+                        self._act_on_alerts(position_id, alerts)
+                        for position_id, alerts in zip(position_ids, alert_results)
+                    ])
+                except Exception as e:
+                    logger.error("Error checking positions for %s: %s", mint_address, e)
+                    
+        except asyncio.CancelledError:
+            pass
+    
+    async def _check_positions(self):
+        """Refresh prices for all open positions and act on triggered alerts"""
+        positions = list(self.risk_manager.positions.items())
+        if not positions:
+            return
+        
+        # Single price request covering every distinct mint, when the client supports it;
+        # otherwise check against the last pushed or recorded price
+        get_prices_bulk = getattr(self.pumpportal_client, 'get_prices_bulk', None)
+        if get_prices_bulk:
+            prices = await get_prices_bulk({position.mint_address for _, position in positions})
+        else:
+            prices = self._latest_prices
+        
+        alert_results = await asyncio.gather(*[
+            self.risk_manager.update_position_price(
+                position_id, prices.get(position.mint_address, position.current_price)
+            )
+            for position_id, position in positions
+        ])
+        
+        await asyncio.gather(*[
+            self._act_on_alerts(position_id, alerts)
+            for (position_id, _), alerts in zip(positions, alert_results)
+        ])
+    
+    async def _act_on_alerts(self, position_id: str, alerts):
+        """Execute at most one sell for a position's alerts; stop loss takes precedence"""
+        if not alerts or position_id in self._closing_positions:
+            return
+        
+        alert_types = {alert.alert_type.value for alert in alerts}
+        if "position_stop_loss" in alert_types:
+            logger.warning("Stop loss triggered for %s", position_id)
+            action = self.execute_stop_loss(position_id)
+        elif "position_take_profit" in alert_types:
+            logger.info("Take profit triggered for %s", position_id)
+            action = self.execute_take_profit(position_id, 0.5)  # Sell 50%
+        else:
+            return
+        
+        # Guard against the sweep and a price push selling the same position twice
+        self._closing_positions.add(position_id)
+        try:
+            await action
+        finally:
+            self._closing_positions.discard(position_id)
     
     def get_execution_status(self, execution_id: str) -> Optional[Dict[str, Any]]:
         """Get status of a specific execution"""
@@ -528,48 +897,25 @@ class ExecutionEngine:
             return self.pending_executions[execution_id].to_dict()
         
         # Check completed executions
-        for execution in self.completed_executions:
-            if execution.execution_id == execution_id:
-                return execution.to_dict()
-        
-        return None
+        execution = self._completed_index.get(execution_id)
+        return execution.to_dict() if execution else None
     
     def get_execution_summary(self) -> Dict[str, Any]:
         """Get summary of all executions"""
-        try:
-            pending_count = len(self.pending_executions)
-            completed_count = len(self.completed_executions)
-            
-            successful_executions = [
-                ex for ex in self.completed_executions 
-                if ex.status == ExecutionStatus.COMPLETED
-            ]
-            failed_executions = [
-                ex for ex in self.completed_executions 
-                if ex.status == ExecutionStatus.FAILED
-            ]
-            
-            total_volume = sum(
-                ex.actual_amount * ex.actual_price 
-                for ex in successful_executions
-            )
-            
-            average_slippage = sum(ex.slippage for ex in successful_executions) / len(successful_executions) if successful_executions else 0
-            
-            return {
-                'pending_executions': pending_count,
-                'completed_executions': completed_count,
-                'successful_executions': len(successful_executions),
-                'failed_executions': len(failed_executions),
-                'success_rate': len(successful_executions) / completed_count * 100 if completed_count > 0 else 0,
-                'total_volume': total_volume,
-                'average_slippage': average_slippage,
-                'queue_size': self.execution_queue.qsize()
-            }
-            
-        except Exception as e:
-            logger.error(f"Error generating execution summary: {str(e)}")
-            return {}
+        completed_count = self._agg_completed
+        successful_count = self._agg_success
+        
+        return {
+            'pending_executions': len(self.pending_executions),
+            'completed_executions': completed_count,
+            'successful_executions': successful_count,
+            'failed_executions': self._agg_failed,
+            'success_rate': successful_count / completed_count * 100 if completed_count > 0 else 0,
+            'total_volume': self._agg_volume,
+            'average_slippage': self._slip_mean if self._slip_n else 0,
+            'queue_size': self.execution_queue.qsize(),
+            'queue_full': self._queue_full
+        }
     
     async def cancel_execution(self, execution_id: str) -> bool:
         """Cancel a pending execution"""
@@ -578,17 +924,18 @@ class ExecutionEngine:
                 execution = self.pending_executions[execution_id]
                 if execution.status == ExecutionStatus.PENDING:
                     execution.status = ExecutionStatus.CANCELLED
-                    logger.info(f"Execution {execution_id} cancelled")
+                    self._archive_execution(execution)
+                    logger.info("Execution %s cancelled", execution_id)
                     return True
                 else:
-                    logger.warning(f"Cannot cancel execution {execution_id} with status {execution.status}")
+                    logger.warning("Cannot cancel execution %s with status %s", execution_id, execution.status)
                     return False
             else:
-                logger.warning(f"Execution not found: {execution_id}")
+                logger.warning("Execution not found: %s", execution_id)
                 return False
                 
         except Exception as e:
-            logger.error(f"Error cancelling execution: {str(e)}")
+            logger.error("Error cancelling execution: %s", e)
             return False
     
     async def cleanup(self):
@@ -596,11 +943,34 @@ class ExecutionEngine:
         try:
             self.is_running = False
             
+            tasks = self.workers + list(self._mint_watchers.values())
+            if self.monitoring_task:
+                tasks.append(self.monitoring_task)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.workers = []
+            self.monitoring_task = None
+            self._mint_watchers.clear()
+            self._price_bus.clear()
+            self._latest_prices.clear()
+            
+            # Nothing will complete queued stop losses/take profits any more
+            for waiter in self._completion_waiters.values():
+                waiter.cancel()
+            self._completion_waiters.clear()
+            
+            # Flush whatever is still queued for the audit log
+            if self.audit_task:
+                await self._audit_queue.put(None)
+                await self.audit_task
+                self.audit_task = None
+            
             if self.pumpportal_client:
                 await self.pumpportal_client.__aexit__(None, None, None)
             
             logger.info("Execution engine cleanup completed")
             
         except Exception as e:
-            logger.error(f"Error during execution engine cleanup: {str(e)}")
+            logger.error("Error during execution engine cleanup: %s", e)
 
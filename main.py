@@ -3,8 +3,10 @@ Updated main application with enhanced components integration
 """
 import asyncio
 import logging
+import random
 import signal
 import sys
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
@@ -27,8 +29,44 @@ from src.monitoring.alert_system import AlertSystem
 from src.monitoring.safety_circuit import SafetyCircuit
 from src.monitoring.logger import setup_logging
 
+try:
+    import uvloop  # libuv-backed event loop; not available on Windows
+except ImportError:
+    uvloop = None
+
+try:
+    from pyleak import no_event_loop_blocking  # Optional development dependency
+except ImportError:
+    no_event_loop_blocking = None
+
+# Loop stalls longer than this are reported in debug runs (seconds)
+BLOCKING_THRESHOLD_S = 0.05
+
+# Minimum spacing of long-term opportunity polls, independent of how fast tokens arrive (seconds)
+LONG_TERM_POLL_INTERVAL_S = getattr(settings, 'LONG_TERM_POLL_INTERVAL_S', 1.0)
+
 logger = logging.getLogger(__name__)
 
+# Long-term grades worth investing in, and sniping recommendations to pass on
+_ACCEPTED_GRADES = frozenset({"A+", "A", "A-", "B+"})
+_REJECTED_RECS = frozenset({"avoid", "skip"})
+
+class _BackoffState:
+    """Jittered exponential retry delay for a loop, reset after a successful iteration"""
+    __slots__ = ('base', 'cap', 'delay')
+    
+    def __init__(self, base: float, cap: float):
+        self.base = base
+        self.cap = cap
+        self.delay = 0.0
+    
+    def next_delay(self) -> float:
+        self.delay = max(self.base, min(self.cap, self.delay * 2))
+        return self.delay + random.uniform(0, self.base)
+    
+    def reset(self):
+        self.delay = 0.0
+
 class EnhancedPumpFunTradingBot:
     """Enhanced Pump.fun Trading Bot with advanced features"""
     
@@ -36,6 +74,10 @@ class EnhancedPumpFunTradingBot:
         self.running = False
         self.shutdown_event = asyncio.Event()
         
+        # Cleared by the safety loop while trading is halted
+        self.trading_allowed = asyncio.Event()
+        self.trading_allowed.set()
+        
         # Core components
         self.data_processor = None
         self.strategy_engine = None
@@ -62,6 +104,21 @@ class EnhancedPumpFunTradingBot:
         self.pumpportal_client = None
         self.bitquery_client = None
         
+        # Components grouped into dependency tiers, in initialization order
+        self._component_tiers: List[List[Any]] = []
+        
+        # Long-running loop tasks owned by start()
+        self._tasks: List[asyncio.Task] = []
+        
+        # (monotonic time, ISO timestamp) reused by get_status for up to a second
+        self._status_ts = (0.0, "")
+        
+        # Caps concurrent per-token pipelines to stay under provider rate limits
+        self._token_sem = asyncio.Semaphore(getattr(settings, 'MAX_PARALLEL_TOKEN_ANALYSES', 8))
+        
+        # Monotonic time before which long-term opportunities are not polled again
+        self._next_long_term_poll = 0.0
+        
     async def initialize(self):
         """Initialize all bot components"""
         try:
@@ -109,6 +166,21 @@ class EnhancedPumpFunTradingBot:
                 self.alert_system
             )
             
+            # Components within a tier are independent; each tier depends on the ones before it
+            self._component_tiers = [
+                # Core components
+                [self.data_processor, self.wallet_manager, self.reputation_manager, self.risk_manager],
+                # Enhanced components
+                [self.mev_protection, self.market_analyzer, self.pumpfun_optimizer],
+                [self.enhanced_execution_engine],
+                # Strategies
+                [self.sniping_strategy, self.long_term_strategy],
+                [self.strategy_engine],
+                # Monitoring
+                [self.performance_monitor, self.alert_system],
+                [self.safety_circuit]
+            ]
+            
             # Initialize all components
             await self._initialize_components()
             
@@ -121,27 +193,9 @@ class EnhancedPumpFunTradingBot:
     async def _initialize_components(self):
         """Initialize all components in correct order"""
         try:
-            # Core components
-            await self.data_processor.initialize()
-            await self.wallet_manager.initialize()
-            await self.reputation_manager.initialize()
-            await self.risk_manager.initialize()
-            
-            # Enhanced components
-            await self.mev_protection.initialize()
-            await self.market_analyzer.initialize()
-            await self.pumpfun_optimizer.initialize()
-            await self.enhanced_execution_engine.initialize()
-            
-            # Strategies
-            await self.sniping_strategy.initialize()
-            await self.long_term_strategy.initialize()
-            await self.strategy_engine.initialize()
-            
-            # Monitoring
-            await self.performance_monitor.initialize()
-            await self.alert_system.initialize()
-            await self.safety_circuit.initialize()
+            # Tiers start in order; components within a tier start concurrently
+            for tier in self._component_tiers:
+                await asyncio.gather(*(component.initialize() for component in tier))
             
             logger.info("All components initialized successfully")
             
@@ -159,25 +213,26 @@ class EnhancedPumpFunTradingBot:
             self.running = True
             logger.info("Starting Enhanced Pump.fun Trading Bot...")
             
-            # Start main trading loop
-            trading_task = asyncio.create_task(self._main_trading_loop())
+            # Eager tasks run synchronously until their first suspension (Python 3.12+)
+            if hasattr(asyncio, 'eager_task_factory'):
+                asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
             
-            # Start monitoring tasks
-            monitoring_task = asyncio.create_task(self._monitoring_loop())
-            
-            # Start safety monitoring
-            safety_task = asyncio.create_task(self._safety_monitoring_loop())
+            # Start trading, monitoring, safety and metrics loops
+            self._tasks = [
+                asyncio.create_task(self._main_trading_loop()),
+                asyncio.create_task(self._monitoring_loop()),
+                asyncio.create_task(self._safety_monitoring_loop()),
+                asyncio.create_task(self._metrics_loop())
+            ]
             
             # Wait for shutdown signal
             await self.shutdown_event.wait()
             
-            # Cancel tasks
-            trading_task.cancel()
-            monitoring_task.cancel()
-            safety_task.cancel()
-            
-            # Wait for tasks to complete
-            await asyncio.gather(trading_task, monitoring_task, safety_task, return_exceptions=True)
+            # Cancel tasks and wait for them to complete
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks.clear()
             
             logger.info("Enhanced Pump.fun Trading Bot stopped")
             
@@ -191,27 +246,27 @@ class EnhancedPumpFunTradingBot:
         """Enhanced main trading loop"""
         try:
             logger.info("Starting enhanced main trading loop...")
+            backoff = _BackoffState(base=1, cap=30)
             
-            while self.running:
+            while True:
                 try:
-                    # Check safety circuit
-                    safety_status = await self.safety_circuit.get_safety_status()
-                    if safety_status['level'] in ['danger', 'emergency']:
-                        logger.warning(f"Trading halted due to safety level: {safety_status['level']}")
-                        await asyncio.sleep(60)  # Wait before checking again
+                    # Halt as soon as the circuit stops allowing trades, without waiting for the 30s safety poll
+                    if self.trading_allowed.is_set() and not self.safety_circuit.is_trading_allowed():
+                        logger.warning("Trading halted by safety circuit")
+                        self.trading_allowed.clear()
+                    
+                    # Wait out a safety halt
+                    if not self.trading_allowed.is_set():
+                        await self.trading_allowed.wait()
                         continue
                     
-                    # Process new tokens with enhanced analysis
+                    # Process new tokens with enhanced analysis (waits up to 1s for new tokens)
                     await self._process_new_tokens_enhanced()
                     
                     # Process long-term opportunities
                     await self._process_long_term_opportunities()
                     
-                    # Update performance metrics
-                    await self._update_performance_metrics()
-                    
-                    # Brief pause before next iteration
-                    await asyncio.sleep(1)
+                    backoff.reset()
                     
                 except asyncio.CancelledError:
                     logger.info("Main trading loop cancelled")
@@ -223,7 +278,7 @@ class EnhancedPumpFunTradingBot:
                         "trading",
                         f"Main trading loop error: {str(e)}"
                     )
-                    await asyncio.sleep(5)  # Brief pause before retry
+                    await asyncio.sleep(backoff.next_delay())
                     
         except Exception as e:
             logger.error(f"Fatal error in main trading loop: {str(e)}")
@@ -233,81 +288,126 @@ class EnhancedPumpFunTradingBot:
         """Process new tokens with enhanced analysis"""
         try:
             # Get new tokens from data processor
-            new_tokens = await self.data_processor.get_new_tokens()
+            new_tokens = await self._next_new_tokens()
             
-            for token_data in new_tokens:
-                try:
-                    # Enhanced sniping analysis
-                    sniping_analysis = await self.sniping_strategy.analyze_new_token(token_data)
-                    
-                    if sniping_analysis.recommendation not in ["avoid", "skip"]:
-                        # Generate trading signal
-                        signal = await self.sniping_strategy.generate_trading_signal(sniping_analysis)
-                        
-                        if signal:
-                            # Execute with enhanced engine
-                            execution_result = await self.enhanced_execution_engine.execute_signal_enhanced(
-                                signal, token_data
-                            )
-                            
-                            # Log execution result
-                            if execution_result.success:
-                                logger.info(
-                                    f"Enhanced execution successful: {execution_result.execution_id}, "
-                                    f"Price: {execution_result.executed_price:.6f}, "
-                                    f"Slippage: {execution_result.slippage:.3f}, "
-                                    f"MEV Protected: {execution_result.mev_protection_applied}"
-                                )
-                            else:
-                                logger.warning(
-                                    f"Enhanced execution failed: {execution_result.execution_id}, "
-                                    f"Error: {execution_result.error_message}"
-                                )
-                            
-                            # Update performance tracking
-                            await self.performance_monitor.record_trade_execution(execution_result)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing token {token_data.get('mint', 'unknown')}: {str(e)}")
-                    continue
+            # Tokens are independent, so their pipelines run concurrently
+            await asyncio.gather(
+                *(self._process_one_token(token_data) for token_data in new_tokens),
+                return_exceptions=True
+            )
                     
         except Exception as e:
             logger.error(f"Error in enhanced new token processing: {str(e)}")
     
+    async def _next_new_tokens(self) -> List[Dict[str, Any]]:
+        """Wait up to a second for pushed tokens, falling back to polling the data processor"""
+        queue = getattr(self.data_processor, 'new_token_queue', None)
+        if queue is None:
+            await asyncio.sleep(1)
+            return await self.data_processor.get_new_tokens()
+        
+        try:
+            new_tokens = [await asyncio.wait_for(queue.get(), timeout=1.0)]
+        except asyncio.TimeoutError:
+            return []
+        
+        # Drain whatever else arrived in the same burst
+        while not queue.empty():
+            new_tokens.append(queue.get_nowait())
+        
+        return new_tokens
+    
+    async def _process_one_token(self, token_data: Dict[str, Any]):
+        """Run analysis, signal generation and execution for a single new token"""
+        async with self._token_sem:
+            try:
+                # Enhanced sniping analysis
+                sniping_analysis = await self.sniping_strategy.analyze_new_token(token_data)
+                
+                if sniping_analysis.recommendation not in _REJECTED_RECS:
+                    # Generate trading signal
+                    signal = await self.sniping_strategy.generate_trading_signal(sniping_analysis)
+                    
+                    if signal:
+                        # Execute with enhanced engine
+                        execution_result = await self.enhanced_execution_engine.execute_signal_enhanced(
+                            signal, token_data
+                        )
+                        
+                        # Log execution result
+                        if execution_result.success:
+                            logger.info(
+                                "Enhanced execution successful: %s, Price: %.6f, Slippage: %.3f, MEV Protected: %s",
+                                execution_result.execution_id,
+                                execution_result.executed_price,
+                                execution_result.slippage,
+                                execution_result.mev_protection_applied
+                            )
+                        else:
+                            logger.warning(
+                                "Enhanced execution failed: %s, Error: %s",
+                                execution_result.execution_id,
+                                execution_result.error_message
+                            )
+                        
+                        # Update performance tracking
+                        await self.performance_monitor.record_trade_execution(execution_result)
+                
+            except Exception as e:
+                logger.error(f"Error processing token {token_data.get('mint', 'unknown')}: {str(e)}")
+    
     async def _process_long_term_opportunities(self):
         """Process long-term investment opportunities"""
         try:
+            # Pushed tokens can wake the trading loop many times a second; keep this poll on its own interval
+            now = time.monotonic()
+            if now < self._next_long_term_poll:
+                return
+            self._next_long_term_poll = now + LONG_TERM_POLL_INTERVAL_S
+            
             # Get potential long-term investments
             opportunities = await self.data_processor.get_long_term_opportunities()
             
-            for opportunity in opportunities:
-                try:
-                    # Long-term analysis
-                    analysis = await self.long_term_strategy.analyze_investment_opportunity(opportunity)
-                    
-                    if analysis.investment_grade in ["A+", "A", "A-", "B+"]:
-                        # Generate investment signal
-                        signal = await self.long_term_strategy.generate_investment_signal(analysis)
-                        
-                        if signal:
-                            # Execute with enhanced engine
-                            execution_result = await self.enhanced_execution_engine.execute_signal_enhanced(
-                                signal, opportunity
-                            )
-                            
-                            # Update performance tracking
-                            await self.performance_monitor.record_trade_execution(execution_result)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing long-term opportunity: {str(e)}")
-                    continue
+            await asyncio.gather(
+                *(self._process_one_opportunity(opportunity) for opportunity in opportunities),
+                return_exceptions=True
+            )
                     
         except Exception as e:
             logger.error(f"Error in long-term opportunity processing: {str(e)}")
     
+    async def _process_one_opportunity(self, opportunity: Dict[str, Any]):
+        """Analyze and, if investment grade, execute a single long-term opportunity"""
+        async with self._token_sem:
+            try:
+                # Long-term analysis
+                analysis = await self.long_term_strategy.analyze_investment_opportunity(opportunity)
+                
+                if analysis.investment_grade in _ACCEPTED_GRADES:
+                    # Generate investment signal
+                    signal = await self.long_term_strategy.generate_investment_signal(analysis)
+                    
+                    if signal:
+                        # Execute with enhanced engine
+                        execution_result = await self.enhanced_execution_engine.execute_signal_enhanced(
+                            signal, opportunity
+                        )
+                        
+                        # Update performance tracking
+                        await self.performance_monitor.record_trade_execution(execution_result)
+                
+            except Exception as e:
+                logger.error(f"Error processing long-term opportunity: {str(e)}")
+    
     async def _update_performance_metrics(self):
         """Update performance metrics"""
         try:
+            # Single-pass update when the monitor supports it
+            update_all = getattr(self.performance_monitor, 'update_all', None)
+            if update_all:
+                await update_all()
+                return
+            
             # Update strategy performance
             await self.performance_monitor.update_strategy_performance()
             
@@ -320,25 +420,41 @@ class EnhancedPumpFunTradingBot:
         except Exception as e:
             logger.error(f"Error updating performance metrics: {str(e)}")
     
+    async def _metrics_loop(self):
+        """Refresh performance metrics off the trading hot path"""
+        try:
+            while True:
+                await self._update_performance_metrics()
+                await asyncio.sleep(5)  # Update every 5 seconds
+                
+        except asyncio.CancelledError:
+            logger.info("Metrics loop cancelled")
+    
     async def _monitoring_loop(self):
         """Enhanced monitoring loop"""
         try:
             logger.info("Starting enhanced monitoring loop...")
+            backoff = _BackoffState(base=5, cap=120)
             
-            while self.running:
+            while True:
                 try:
-                    # Generate performance reports
-                    await self._generate_performance_reports()
+                    # Fetch MEV stats once per tick for both consumers
+                    mev_stats = self.mev_protection.get_protection_stats()
                     
-                    # Check for alerts
-                    await self._check_system_alerts()
-                    
-                    # Update reputation scores
-                    await self._update_reputation_scores()
+                    # Reports, alerts, reputation and component checks touch disjoint subsystems
+                    results = await asyncio.gather(
+                        self._generate_performance_reports(mev_stats),
+                        self._check_system_alerts(),
+                        self._update_reputation_scores(),
+                        self._monitor_enhanced_components(mev_stats),
+                        return_exceptions=True
+                    )
                     
-                    # Monitor enhanced components
-                    await self._monitor_enhanced_components()
+                    for result in results:
+                        if isinstance(result, Exception):
+                            logger.error(f"Error in monitoring task: {str(result)}")
                     
+                    backoff.reset()
                     await asyncio.sleep(60)  # Monitor every minute
                     
                 except asyncio.CancelledError:
@@ -346,7 +462,7 @@ class EnhancedPumpFunTradingBot:
                     break
                 except Exception as e:
                     logger.error(f"Error in monitoring loop: {str(e)}")
-                    await asyncio.sleep(30)  # Brief pause before retry
+                    await asyncio.sleep(backoff.next_delay())
                     
         except Exception as e:
             logger.error(f"Fatal error in monitoring loop: {str(e)}")
@@ -355,8 +471,9 @@ class EnhancedPumpFunTradingBot:
         """Enhanced safety monitoring loop"""
         try:
             logger.info("Starting enhanced safety monitoring loop...")
+            backoff = _BackoffState(base=5, cap=60)
             
-            while self.running:
+            while True:
                 try:
                     # Check safety circuit
                     await self.safety_circuit.check_safety_conditions()
@@ -367,6 +484,17 @@ class EnhancedPumpFunTradingBot:
                     # Check for emergency conditions
                     await self._check_emergency_conditions()
                     
+                    # Halt or resume the trading loop, after the checks above have updated the safety level
+                    safety_status = await self.safety_circuit.get_safety_status()
+                    if safety_status['level'] in ['danger', 'emergency']:
+                        if self.trading_allowed.is_set():
+                            logger.warning(f"Trading halted due to safety level: {safety_status['level']}")
+                            self.trading_allowed.clear()
+                    elif not self.trading_allowed.is_set() and self.safety_circuit.is_trading_allowed():
+                        logger.info("Safety level recovered, resuming trading")
+                        self.trading_allowed.set()
+                    
+                    backoff.reset()
                     await asyncio.sleep(30)  # Check every 30 seconds
                     
                 except asyncio.CancelledError:
@@ -374,30 +502,32 @@ class EnhancedPumpFunTradingBot:
                     break
                 except Exception as e:
                     logger.error(f"Error in safety monitoring: {str(e)}")
-                    await asyncio.sleep(15)  # Brief pause before retry
+                    await asyncio.sleep(backoff.next_delay())
                     
         except Exception as e:
             logger.error(f"Fatal error in safety monitoring: {str(e)}")
     
-    async def _generate_performance_reports(self):
+    async def _generate_performance_reports(self, mev_stats: Dict[str, Any]):
         """Generate enhanced performance reports"""
         try:
+            # The report is only logged, so skip gathering it when INFO is disabled
+            if not logger.isEnabledFor(logging.INFO):
+                return
+            
             # Get comprehensive performance data
             performance_data = await self.performance_monitor.get_comprehensive_performance()
             
             # Get execution engine performance
             execution_summary = self.enhanced_execution_engine.get_execution_summary()
             
-            # Get MEV protection stats
-            mev_stats = self.mev_protection.get_protection_stats()
-            
             # Log enhanced performance summary
             logger.info(
-                f"Enhanced Performance Summary - "
-                f"Total Return: {performance_data.get('total_return_percent', 0):.2f}%, "
-                f"Success Rate: {execution_summary.get('success_rate', 0):.1f}%, "
-                f"MEV Protection: {mev_stats.get('mev_attacks_prevented', 0)} attacks prevented, "
-                f"Avg Slippage: {execution_summary.get('average_slippage', 0):.3f}"
+                "Enhanced Performance Summary - Total Return: %.2f%%, Success Rate: %.1f%%, "
+                "MEV Protection: %s attacks prevented, Avg Slippage: %.3f",
+                performance_data.get('total_return_percent', 0),
+                execution_summary.get('success_rate', 0),
+                mev_stats.get('mev_attacks_prevented', 0),
+                execution_summary.get('average_slippage', 0)
             )
             
         except Exception as e:
@@ -423,13 +553,13 @@ class EnhancedPumpFunTradingBot:
         except Exception as e:
             logger.error(f"Error updating reputation scores: {str(e)}")
     
-    async def _monitor_enhanced_components(self):
+    async def _monitor_enhanced_components(self, mev_stats: Dict[str, Any]):
         """Monitor enhanced component performance"""
         try:
             # Monitor MEV protection effectiveness
-            mev_stats = self.mev_protection.get_protection_stats()
-            if mev_stats.get('total_protected_transactions', 0) > 0:
-                protection_rate = mev_stats.get('mev_attacks_prevented', 0) / mev_stats['total_protected_transactions']
+            total_protected = mev_stats.get('total_protected_transactions', 0)
+            if total_protected > 0:
+                protection_rate = mev_stats.get('mev_attacks_prevented', 0) / total_protected
                 if protection_rate < 0.8:  # Less than 80% protection rate
                     await self.alert_system.send_alert(
                         "medium",
@@ -466,6 +596,7 @@ class EnhancedPumpFunTradingBot:
             
             if emergency_status['emergency_triggered']:
                 logger.critical(f"Emergency condition detected: {emergency_status['reason']}")
+                self.trading_allowed.clear()
                 await self.safety_circuit.trigger_emergency_stop(emergency_status['reason'])
                 
         except Exception as e:
@@ -476,7 +607,7 @@ class EnhancedPumpFunTradingBot:
         try:
             logger.info("Stopping Enhanced Pump.fun Trading Bot...")
             
-            self.running = False
+            # start() cancels the loop tasks once the shutdown event fires
             self.shutdown_event.set()
             
             # Cleanup components
@@ -490,60 +621,32 @@ class EnhancedPumpFunTradingBot:
     async def _cleanup_components(self):
         """Cleanup all components"""
         try:
-            # Cleanup in reverse order of initialization
-            if self.safety_circuit:
-                await self.safety_circuit.cleanup()
-            
-            if self.alert_system:
-                await self.alert_system.cleanup()
-            
-            if self.performance_monitor:
-                await self.performance_monitor.cleanup()
-            
-            if self.strategy_engine:
-                await self.strategy_engine.cleanup()
-            
-            if self.long_term_strategy:
-                await self.long_term_strategy.cleanup()
-            
-            if self.sniping_strategy:
-                await self.sniping_strategy.cleanup()
-            
-            if self.enhanced_execution_engine:
-                await self.enhanced_execution_engine.cleanup()
-            
-            if self.pumpfun_optimizer:
-                await self.pumpfun_optimizer.cleanup()
-            
-            if self.market_analyzer:
-                await self.market_analyzer.cleanup()
-            
-            if self.mev_protection:
-                await self.mev_protection.cleanup()
-            
-            if self.risk_manager:
-                await self.risk_manager.cleanup()
-            
-            if self.reputation_manager:
-                await self.reputation_manager.cleanup()
-            
-            if self.wallet_manager:
-                await self.wallet_manager.cleanup()
-            
-            if self.data_processor:
-                await self.data_processor.cleanup()
+            # Cleanup in reverse order of initialization, one tier at a time
+            for tier in reversed(self._component_tiers):
+                results = await asyncio.gather(
+                    *(component.cleanup() for component in tier),
+                    return_exceptions=True
+                )
+                
+                for component, result in zip(tier, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"Error cleaning up {type(component).__name__}: {str(result)}")
             
             logger.info("All components cleaned up successfully")
             
         except Exception as e:
             logger.error(f"Error during component cleanup: {str(e)}")
     
-    def get_status(self) -> Dict[str, Any]:
+    async def get_status(self) -> Dict[str, Any]:
         """Get enhanced bot status"""
         try:
+            now = time.monotonic()
+            if now - self._status_ts[0] > 1.0:
+                self._status_ts = (now, datetime.utcnow().isoformat())
+            
             status = {
                 'running': self.running,
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': self._status_ts[1],
                 'components': {
                     'data_processor': bool(self.data_processor),
                     'strategy_engine': bool(self.strategy_engine),
@@ -556,9 +659,7 @@ class EnhancedPumpFunTradingBot:
             }
             
             if self.performance_monitor:
-                status['performance'] = asyncio.create_task(
-                    self.performance_monitor.get_current_performance()
-                )
+                status['performance'] = await self.performance_monitor.get_current_performance()
             
             if self.enhanced_execution_engine:
                 status['execution_summary'] = self.enhanced_execution_engine.get_execution_summary()
@@ -569,13 +670,53 @@ class EnhancedPumpFunTradingBot:
             logger.error(f"Error getting bot status: {str(e)}")
             return {'running': self.running, 'error': str(e)}
 
+# Strong references to scheduled stop tasks; the event loop only keeps weak ones
+_stop_tasks = set()
+
+def _request_shutdown(bot, signum):
+    """Schedule bot.stop() for the first shutdown signal; later signals are ignored while it runs"""
+    if bot.shutdown_event.is_set():
+        logger.info(f"Received signal {signum}, shutdown already in progress")
+        return
+    
+    logger.info(f"Received signal {signum}, initiating shutdown...")
+    bot.shutdown_event.set()
+    task = asyncio.create_task(bot.stop())
+    _stop_tasks.add(task)
+    task.add_done_callback(_stop_tasks.discard)
+
 def signal_handler(bot):
-    """Handle shutdown signals"""
+    """Handle shutdown signals (fallback for platforms without loop signal handlers)"""
+    loop = asyncio.get_running_loop()
     def handler(signum, frame):
-        logger.info(f"Received signal {signum}, initiating shutdown...")
-        asyncio.create_task(bot.stop())
+        loop.call_soon_threadsafe(_request_shutdown, bot, signum)
     return handler
 
+def install_signal_handlers(bot):
+    """Route SIGINT/SIGTERM through the event loop so shutdown is scheduled safely"""
+    loop = asyncio.get_running_loop()
+    
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, _request_shutdown, bot, sig)
+        except NotImplementedError:
+            # Windows event loops don't support add_signal_handler
+            signal.signal(sig, signal_handler(bot))
+
+async def run_with_blocking_detection(bot):
+    """Run the bot while reporting synchronous calls that stall the event loop"""
+    if no_event_loop_blocking is not None:
+        async with no_event_loop_blocking(threshold=BLOCKING_THRESHOLD_S):
+            await bot.start()
+        return
+    
+    # Without pyleak, asyncio debug mode still logs callbacks slower than the threshold
+    logger.info("pyleak not installed, using asyncio slow callback logging")
+    loop = asyncio.get_running_loop()
+    loop.set_debug(True)
+    loop.slow_callback_duration = BLOCKING_THRESHOLD_S
+    await bot.start()
+
 async def main():
     """Enhanced main function"""
     try:
@@ -589,11 +730,13 @@ async def main():
         await bot.initialize()
         
         # Setup signal handlers
-        signal.signal(signal.SIGINT, signal_handler(bot))
-        signal.signal(signal.SIGTERM, signal_handler(bot))
+        install_signal_handlers(bot)
         
         # Start bot
-        await bot.start()
+        if getattr(settings, 'DEBUG', False):
+            await run_with_blocking_detection(bot)
+        else:
+            await bot.start()
         
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt, shutting down...")
@@ -602,5 +745,7 @@ async def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
 
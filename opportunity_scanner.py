@@ -2,15 +2,150 @@
 Opportunity Scanner - Real-time scanning tool for high-potential pump.fun opportunities
 """
 import asyncio
+import bisect
+import functools
+import heapq
 import logging
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict, deque
+from collections.abc import Mapping, Sized
+from numbers import Real
+from operator import attrgetter
+from typing import Dict, List, Optional, Any, Tuple, Callable
+from datetime import datetime
 import json
 from dataclasses import dataclass
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# How long analysis results are reused per mint (seconds), by how fast the inputs move
+SIGNAL_CACHE_TTL_S = 60
+SNIPING_CACHE_TTL_S = 60
+PUMP_METRICS_CACHE_TTL_S = 120
+DEV_ANALYSIS_CACHE_TTL_S = 300
+
+# Expired cache entries are swept once a cache grows past this many mints
+CACHE_SWEEP_SIZE = 1024
+
+# Mints skipped after analysis (seconds), and how many are remembered
+RECENT_ANALYSIS_WINDOW_S = 600.0
+RECENT_ANALYSIS_LIMIT = 4096
+
+# Seconds an opportunity stays active after it was last added
+ACTIVE_OPPORTUNITY_TTL_S = 3600.0
+
+# Initial slot count of the active opportunity arrays; doubled when full
+ACTIVE_SLOT_CAPACITY = 256
+
+# Tokens analyzed concurrently per scan pass
+MAX_CONCURRENT_ANALYSES = 16
+
+# Risk level by whole rug-risk score (6 = 6.0 and above), then developer risk level
+_RISK_TABLE: Tuple[Tuple[Dict[str, str], str], ...] = (
+    ({'very_low': 'low', 'low': 'low', 'medium': 'medium'}, 'high'),
+    ({'very_low': 'low', 'low': 'low', 'medium': 'medium'}, 'high'),
+    ({'very_low': 'medium', 'low': 'medium', 'medium': 'medium'}, 'high'),
+    ({'very_low': 'medium', 'low': 'medium', 'medium': 'medium'}, 'high'),
+    ({}, 'high'),
+    ({}, 'high'),
+    ({}, 'very_high'),
+)
+
+# Risk levels produced by _RISK_TABLE, by their code in the active opportunity arrays
+_RISK_NAMES = ('low', 'medium', 'high', 'very_high')
+_RISK_CODES = {name: code for code, name in enumerate(_RISK_NAMES)}
+
+# Entry recommendation by score band, then risk class (low, medium, other), then whether liquidity allows execution
+_SCORE_BANDS = (5.0, 6.5, 7.5, 8.5)
+_RISK_CLASS = {'low': 0, 'medium': 1}
+_REC_TABLE: Tuple[Tuple[Tuple[str, str], ...], ...] = (
+    (('avoid', 'avoid'), ('avoid', 'avoid'), ('avoid', 'avoid')),                      # < 5.0
+    (('monitor', 'monitor'), ('monitor', 'monitor'), ('monitor', 'monitor')),          # 5.0 - 6.5
+    (('consider', 'consider'), ('monitor', 'monitor'), ('monitor', 'monitor')),        # 6.5 - 7.5
+    (('buy', 'buy'), ('buy', 'buy'), ('monitor', 'monitor')),                          # 7.5 - 8.5
+    (('buy', 'strong_buy'), ('buy', 'strong_buy'), ('monitor', 'monitor')),            # >= 8.5
+)
+
+# Score adjustments for market conditions
+_LIQUIDITY_ADJ = {'excellent': 0.3, 'poor': -0.5}
+_WHALE_ADJ = {'bullish': 0.3, 'bearish': -0.5}
+
+def _score_kernel(base: np.ndarray, migration: np.ndarray, dev_risk: np.ndarray,
+                  liquidity_adj: np.ndarray, whale_adj: np.ndarray) -> np.ndarray:
+    """Opportunity scores for a batch of tokens, clipped to 0-10"""
+    score = base + np.where(migration > 0.8, 0.5, np.where(migration < 0.3, -1.0, 0.0))
+    score += np.where(dev_risk < 2.0, 0.5, np.where(dev_risk > 7.0, -2.0, 0.0))
+    score += liquidity_adj
+    score += whale_adj
+    return np.clip(score, 0.0, 10.0, out=score)
+
+def _potential_kernel(base: np.ndarray, migration: np.ndarray, bonding: np.ndarray) -> np.ndarray:
+    """Potential return percentages for a batch of tokens, capped at 1000%"""
+    # Up to 200% to graduation, scaled by token quality and migration probability
+    potential = (1.0 - bonding) * 200 * (base / 10.0) * migration
+    
+    # Additional 100% post-graduation potential if high quality
+    potential += np.where((base > 8.0) & (migration > 0.8), 100.0, 0.0)
+    return np.minimum(potential, 1000.0, out=potential)
+
+# Identical factor combinations share one tuple across all signals
+_FACTOR_TUPLES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+def _shared_factors(factors: List[str]) -> Tuple[str, ...]:
+    factors = tuple(factors)
+    return _FACTOR_TUPLES.setdefault(factors, factors)
+
+def _mint_key(token_data: Dict[str, Any]) -> str:
+    return token_data.get('mint', '')
+
+async def _resolved(value):
+    return value
+
+def async_cached(ttl: float, key: Callable[..., Any]):
+    """Cache an async callable's results for ttl seconds; concurrent calls with the same key share one future"""
+    def decorator(func):
+        cache: Dict[Any, Tuple[asyncio.Future, float]] = {}
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs)
+            now = time.monotonic()
+            
+            entry = cache.get(cache_key)
+            if entry and now < entry[1]:
+                return await asyncio.shield(entry[0])
+            
+            if len(cache) > CACHE_SWEEP_SIZE:
+                for stale in [k for k, (_, expires) in cache.items() if expires <= now]:
+                    del cache[stale]
+            
+            # In flight until the call finishes; the TTL starts at completion
+            future = asyncio.get_running_loop().create_future()
+            cache[cache_key] = (future, float('inf'))
+            
+            try:
+                result = await func(*args, **kwargs)
+            except asyncio.CancelledError:
+                cache.pop(cache_key, None)
+                future.cancel()
+                raise
+            except Exception as e:
+                # Failures are not cached; waiters see the same error
+                cache.pop(cache_key, None)
+                future.set_exception(e)
+                future.exception()  # Mark retrieved when nobody else was waiting
+                raise
+            
+            future.set_result(result)
+            cache[cache_key] = (future, time.monotonic() + ttl)
+            return result
+        
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+@dataclass(slots=True, frozen=True)
 class OpportunitySignal:
     """Opportunity signal data structure"""
     mint_address: str
@@ -21,8 +156,8 @@ class OpportunitySignal:
     confidence_level: float
     time_sensitivity: str
     entry_recommendation: str
-    key_factors: List[str]
-    risk_factors: List[str]
+    key_factors: Tuple[str, ...]
+    risk_factors: Tuple[str, ...]
     timestamp: datetime
 
 class OpportunityScanner:
@@ -39,12 +174,48 @@ class OpportunityScanner:
         self.max_rug_risk = 3.0
         self.min_confidence = 0.6
         self.scan_interval = 30  # seconds
+        self.max_bonding_curve_progress = 0.9  # Later entries are skipped before analysis
+        self.blocked_creators = frozenset()
+        self._meets_criteria = self._make_meets_criteria(self.min_score_threshold, self.min_confidence)
         
         # Opportunity tracking
         self.active_opportunities = {}
-        self.opportunity_history = []
+        self.opportunity_history = deque(maxlen=1000)  # Keep only recent history
         self.scanning_active = False
         
+        self._analysis_sem = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+        
+        # mint -> monotonic time it was last made active, and a (time, mint) min-heap for
+        # expiring them; heap entries for since re-added mints are skipped
+        self._active_since: Dict[str, float] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        
+        # Score and risk code of each active opportunity in contiguous arrays for the summary;
+        # the first len(_slot_mints) slots are live and _mint_index maps mint -> slot
+        self._slot_scores = np.empty(ACTIVE_SLOT_CAPACITY, dtype=np.float64)
+        self._slot_risk = np.empty(ACTIVE_SLOT_CAPACITY, dtype=np.intp)
+        self._slot_mints: List[str] = []
+        self._mint_index: Dict[str, int] = {}
+        
+        # (limit, result) of the last get_top_opportunities call; cleared when active opportunities change
+        self._topk_cache: Optional[Tuple[int, List[OpportunitySignal]]] = None
+        
+        # mint -> monotonic time of its latest history entry, oldest first
+        self._last_analyzed: OrderedDict = OrderedDict()
+        
+        # Per-mint analysis caches: full signals, and each upstream sub-analysis
+        self._signal_cache: Dict[str, Tuple[OpportunitySignal, float]] = {}
+        
+        # Tokens seen by the pre-analysis filter, and how many it rejected
+        self._prefilter_checked = 0
+        self._prefilter_rejected = 0
+        
+        # mint -> future of an analysis still running, so concurrent requests share it
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._analyze_new_token = async_cached(SNIPING_CACHE_TTL_S, _mint_key)(sniping_strategy.analyze_new_token)
+        self._get_pump_fun_metrics = async_cached(PUMP_METRICS_CACHE_TTL_S, _mint_key)(pumpfun_optimizer.get_pump_fun_metrics)
+        self._analyze_dev_behavior = async_cached(DEV_ANALYSIS_CACHE_TTL_S, _mint_key)(pumpfun_optimizer.analyze_dev_behavior)
+        
     async def start_scanning(self, config: Dict[str, Any] = None):
         """Start real-time opportunity scanning"""
         try:
@@ -57,8 +228,8 @@ class OpportunityScanner:
             # Start scanning loop
             asyncio.create_task(self._scanning_loop())
             
-        except Exception as e:
-            logger.error(f"Error starting opportunity scanner: {str(e)}")
+        except Exception:
+            logger.exception("Error starting opportunity scanner")
             raise
     
     def _update_config(self, config: Dict[str, Any]):
@@ -67,12 +238,21 @@ class OpportunityScanner:
         self.max_rug_risk = config.get('max_rug_risk', 3.0)
         self.min_confidence = config.get('min_confidence', 0.6)
         self.scan_interval = config.get('scan_interval', 30)
+        self.max_bonding_curve_progress = config.get('max_bonding_curve_progress', 0.9)
+        self.blocked_creators = frozenset(config.get('blocked_creators', ()))
+        self._meets_criteria = self._make_meets_criteria(self.min_score_threshold, self.min_confidence)
     
     async def _scanning_loop(self):
         """Main scanning loop"""
         try:
+            loop = asyncio.get_running_loop()
+            next_deadline = loop.time()
+            
             while self.scanning_active:
                 try:
+                    # Scans start on a fixed cadence regardless of how long each pass takes
+                    next_deadline += self.scan_interval
+                    
                     # Scan for new opportunities
                     opportunities = await self._scan_for_opportunities()
                     
@@ -85,16 +265,22 @@ class OpportunityScanner:
                     # Log top opportunities
                     await self._log_top_opportunities(ranked_opportunities)
                     
-                    await asyncio.sleep(self.scan_interval)
+                    now = loop.time()
+                    if now > next_deadline:
+                        # Overran one or more intervals; skip them rather than scanning back to back
+                        missed = (now - next_deadline) // self.scan_interval + 1
+                        next_deadline += missed * self.scan_interval
+                    await asyncio.sleep(next_deadline - now)
                     
-                except Exception as e:
-                    logger.error(f"Error in scanning loop: {str(e)}")
+                except Exception:
+                    logger.exception("Error in scanning loop")
                     await asyncio.sleep(10)  # Brief pause before retry
+                    next_deadline = loop.time()
                     
         except asyncio.CancelledError:
             logger.info("Opportunity scanning cancelled")
-        except Exception as e:
-            logger.error(f"Fatal error in scanning loop: {str(e)}")
+        except Exception:
+            logger.exception("Fatal error in scanning loop")
     
     async def _scan_for_opportunities(self) -> List[Dict[str, Any]]:
         """Scan for new opportunities"""
@@ -102,391 +288,466 @@ class OpportunityScanner:
             # Get new tokens
             new_tokens = await self.data_processor.get_new_tokens()
             
-            opportunities = []
+            # Skip tokens seen recently or ruled out from their own data; reuse fresh cached signals
+            tokens = [
+                token for token in new_tokens
+                if not self._recently_analyzed(token.get('mint', '')) and self._cheap_prefilter(token)
+            ]
+            signals = {}
+            pending = []
+            for token in tokens:
+                cached = self._cached_signal(token.get('mint', ''))
+                if cached:
+                    signals[cached.mint_address] = cached
+                else:
+                    pending.append(token)
+            
+            # Fetch the rest a bounded number at a time, then score them as one batch
+            pump_map, dev_map = await self._prefetch_batch([token.get('mint', '') for token in pending])
+            results = await asyncio.gather(
+                *(
+                    self._gather_bounded(
+                        token,
+                        pump_metrics=pump_map.get(token.get('mint', '')),
+                        dev_analysis=dev_map.get(token.get('mint', ''))
+                    )
+                    for token in pending
+                ),
+                return_exceptions=True
+            )
             
-            for token in new_tokens:
-                try:
-                    # Skip if already analyzed recently
-                    if self._recently_analyzed(token.get('mint', '')):
-                        continue
-                    
-                    # Perform comprehensive analysis
-                    opportunity = await self._analyze_token_opportunity(token)
-                    
-                    if opportunity and self._meets_criteria(opportunity):
-                        opportunities.append(opportunity)
-                        
-                except Exception as e:
-                    logger.error(f"Error analyzing token {token.get('mint', 'unknown')}: {str(e)}")
-                    continue
+            inputs = []
+            for token, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    logger.error("Error analyzing token %s: %s", token.get('mint', 'unknown'), result)
+                elif result:
+                    # One malformed sub-result must not sink the whole batch
+                    try:
+                        self._check_inputs(result)
+                    except Exception as e:
+                        logger.error("Error analyzing token %s: malformed analysis: %s", token.get('mint', 'unknown'), e)
+                    else:
+                        inputs.append(result)
+            
+            for signal in self._build_signals(inputs):
+                signals[signal.mint_address] = signal
+            
+            # Keep token order so ranking ties resolve as before
+            opportunities = []
+            meets_criteria = self._meets_criteria
+            for token in tokens:
+                opportunity = signals.get(token.get('mint', ''))
+                if opportunity and meets_criteria(opportunity):
+                    opportunities.append(opportunity)
             
             return opportunities
             
-        except Exception as e:
-            logger.error(f"Error scanning for opportunities: {str(e)}")
+        except Exception:
+            logger.exception("Error scanning for opportunities")
             return []
     
-    async def _analyze_token_opportunity(self, token_data: Dict[str, Any]) -> Optional[OpportunitySignal]:
-        """Analyze a single token for opportunity potential"""
+    async def _prefetch_batch(self, mints: List[str]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Fetch pump.fun metrics and developer analysis for a whole scan pass when the optimizer supports batching"""
+        metrics_batch = getattr(self.pumpfun_optimizer, 'get_pump_fun_metrics_batch', None)
+        dev_batch = getattr(self.pumpfun_optimizer, 'analyze_dev_behavior_batch', None)
+        
+        if not mints or not (metrics_batch or dev_batch):
+            return {}, {}
+        
+        pump_map, dev_map = await asyncio.gather(
+            metrics_batch(mints) if metrics_batch else _resolved({}),
+            dev_batch(mints) if dev_batch else _resolved({}),
+            return_exceptions=True
+        )
+        
+        # Tokens missing from a failed batch fall back to per-token calls
+        if isinstance(pump_map, Exception):
+            logger.warning("Batched pump.fun metrics failed: %s", pump_map)
+            pump_map = {}
+        if isinstance(dev_map, Exception):
+            logger.warning("Batched developer analysis failed: %s", dev_map)
+            dev_map = {}
+        
+        return pump_map, dev_map
+    
+    async def _gather_bounded(self, token_data: Dict[str, Any], **prefetched) -> Optional[Tuple]:
+        """Gather a token's analysis inputs while holding a slot of the concurrency limit"""
+        async with self._analysis_sem:
+            return await self._gather_analysis(token_data, **prefetched)
+    
+    def _cached_signal(self, mint_address: str) -> Optional[OpportunitySignal]:
+        """Return a recent analysis of the mint, if any"""
+        cached = self._signal_cache.get(mint_address)
+        if cached and time.monotonic() - cached[1] < SIGNAL_CACHE_TTL_S:
+            return cached[0]
+        return None
+    
+    def _cheap_prefilter(self, token_data: Dict[str, Any]) -> bool:
+        """Reject tokens from fields already in token_data, before any sub-analysis is requested"""
+        self._prefilter_checked += 1
+        
+        progress = token_data.get('bonding_curve_progress')
+        if (progress is not None and progress > self.max_bonding_curve_progress) or \
+                token_data.get('creator') in self.blocked_creators:
+            self._prefilter_rejected += 1
+            return False
+        
+        return True
+    
+    async def _gather_analysis(self, token_data: Dict[str, Any], pump_metrics=None,
+                               dev_analysis=None) -> Optional[Tuple]:
+        """Analyze a token, sharing the result with concurrent calls for the same mint"""
+        mint_address = token_data.get('mint', '')
+        
+        in_flight = self._in_flight.get(mint_address)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[mint_address] = future
+        
+        try:
+            result = await self._fetch_analysis(token_data, pump_metrics, dev_analysis)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        finally:
+            del self._in_flight[mint_address]
+        
+        future.set_result(result)
+        return result
+    
+    async def _fetch_analysis(self, token_data: Dict[str, Any], pump_metrics=None,
+                              dev_analysis=None) -> Optional[Tuple]:
+        """Run a token's sub-analyses; returns (token_data, sniping, pump_metrics, dev_analysis, market_conditions)"""
         try:
             mint_address = token_data.get('mint', '')
             
-            # Enhanced sniping analysis
-            sniping_analysis = await self.sniping_strategy.analyze_new_token(token_data)
-            
-            # Pump.fun specific metrics
-            pump_metrics = await self.pumpfun_optimizer.get_pump_fun_metrics(token_data)
-            
-            # Developer analysis
-            dev_analysis = await self.pumpfun_optimizer.analyze_dev_behavior(token_data)
-            
-            # Market conditions
-            market_conditions = await self.market_analyzer.predict_price_movement(
-                mint_address, 1.0  # 1 SOL trade size for analysis
+            # Sniping analysis, pump.fun metrics, developer analysis and market conditions are independent
+            sniping_analysis, pump_metrics, dev_analysis, market_conditions = await asyncio.gather(
+                self._analyze_new_token(token_data),
+                self._get_pump_fun_metrics(token_data) if pump_metrics is None else _resolved(pump_metrics),
+                self._analyze_dev_behavior(token_data) if dev_analysis is None else _resolved(dev_analysis),
+                self.market_analyzer.predict_price_movement(
+                    mint_address, 1.0  # 1 SOL trade size for analysis
+                ),
+                return_exceptions=True
             )
             
-            # Calculate overall opportunity score
-            opportunity_score = await self._calculate_opportunity_score(
-                sniping_analysis, pump_metrics, dev_analysis, market_conditions
-            )
-            
-            # Determine risk level
-            risk_level = self._determine_risk_level(pump_metrics, dev_analysis)
-            
-            # Calculate potential return
-            potential_return = await self._estimate_potential_return(
-                token_data, sniping_analysis, pump_metrics
-            )
-            
-            # Determine time sensitivity
-            time_sensitivity = self._assess_time_sensitivity(
-                sniping_analysis, pump_metrics, market_conditions
-            )
-            
-            # Generate entry recommendation
-            entry_recommendation = self._generate_entry_recommendation(
-                opportunity_score, risk_level, market_conditions
-            )
-            
-            # Identify key factors
-            key_factors = self._identify_key_factors(
-                sniping_analysis, pump_metrics, dev_analysis
-            )
+            # Scoring cannot proceed without the sniping analysis and pump.fun metrics
+            for result in (sniping_analysis, pump_metrics):
+                if isinstance(result, Exception):
+                    raise result
             
-            # Identify risk factors
-            risk_factors = self._identify_risk_factors(
-                sniping_analysis, pump_metrics, dev_analysis
-            )
+            # Missing developer/market data scores as neutral
+            if isinstance(dev_analysis, Exception):
+                logger.warning("Developer analysis failed for %s: %s", mint_address, dev_analysis)
+                dev_analysis = {}
+            if isinstance(market_conditions, Exception):
+                logger.warning("Market analysis failed for %s: %s", mint_address, market_conditions)
+                market_conditions = {}
             
-            return OpportunitySignal(
-                mint_address=mint_address,
-                token_name=token_data.get('name', 'Unknown'),
-                overall_score=opportunity_score,
-                risk_level=risk_level,
-                potential_return=potential_return,
-                confidence_level=sniping_analysis.confidence_level,
-                time_sensitivity=time_sensitivity,
-                entry_recommendation=entry_recommendation,
-                key_factors=key_factors,
-                risk_factors=risk_factors,
-                timestamp=datetime.utcnow()
-            )
+            return token_data, sniping_analysis, pump_metrics, dev_analysis, market_conditions
             
         except Exception as e:
-            logger.error(f"Error analyzing token opportunity: {str(e)}")
+            logger.error("Error analyzing token opportunity: %s", e)
             return None
     
-    async def _calculate_opportunity_score(self, sniping_analysis, pump_metrics, dev_analysis, market_conditions) -> float:
-        """Calculate comprehensive opportunity score"""
-        try:
-            # Base score from sniping analysis
-            base_score = sniping_analysis.overall_score
-            
-            # Adjust for pump.fun metrics
-            if pump_metrics.migration_probability > 0.8:
-                base_score += 0.5
-            elif pump_metrics.migration_probability < 0.3:
-                base_score -= 1.0
-            
-            # Adjust for developer risk
-            dev_risk = dev_analysis.get('risk_score', 5.0)
-            if dev_risk < 2.0:
-                base_score += 0.5
-            elif dev_risk > 7.0:
-                base_score -= 2.0
-            
-            # Adjust for market conditions
-            liquidity_quality = market_conditions.get('liquidity_quality', 'unknown')
-            if liquidity_quality == 'excellent':
-                base_score += 0.3
-            elif liquidity_quality == 'poor':
-                base_score -= 0.5
-            
-            # Adjust for whale sentiment
-            whale_sentiment = market_conditions.get('whale_sentiment', 'neutral')
-            if whale_sentiment == 'bullish':
-                base_score += 0.3
-            elif whale_sentiment == 'bearish':
-                base_score -= 0.5
-            
-            return max(0.0, min(10.0, base_score))
-            
-        except Exception as e:
-            logger.error(f"Error calculating opportunity score: {str(e)}")
-            return 0.0
+    @staticmethod
+    def _check_inputs(inputs: Tuple):
+        """Raise if a token's analysis lacks a field _build_signals reads, or has a non-numeric score"""
+        _, sniping_analysis, pump_metrics, dev_analysis, market_conditions = inputs
+        
+        if not isinstance(dev_analysis, Mapping) or not isinstance(market_conditions, Mapping):
+            raise TypeError("developer and market analyses must be mappings")
+        if not isinstance(sniping_analysis.red_flags, Sized):
+            raise TypeError("red_flags must be a collection")
+        
+        numbers = (
+            sniping_analysis.overall_score, sniping_analysis.confidence_level,
+            pump_metrics.migration_probability, pump_metrics.bonding_curve_progress,
+            pump_metrics.rug_risk_score, pump_metrics.community_engagement,
+            dev_analysis.get('risk_score', 5.0)
+        )
+        for value in numbers:
+            if not isinstance(value, Real):
+                raise TypeError(f"expected a number, got {type(value).__name__}")
+    
+    def _build_signals(self, inputs: List[Tuple]) -> List[OpportunitySignal]:
+        """Score a batch of analyzed tokens and build their signals"""
+        if not inputs:
+            return []
+        
+        count = len(inputs)
+        base = np.fromiter((sniping.overall_score for _, sniping, _, _, _ in inputs), float, count)
+        migration = np.fromiter((pump.migration_probability for _, _, pump, _, _ in inputs), float, count)
+        bonding = np.fromiter((pump.bonding_curve_progress for _, _, pump, _, _ in inputs), float, count)
+        dev_risk = np.fromiter((dev.get('risk_score', 5.0) for _, _, _, dev, _ in inputs), float, count)
+        liquidity_adj = np.fromiter(
+            (_LIQUIDITY_ADJ.get(market.get('liquidity_quality', 'unknown'), 0.0) for _, _, _, _, market in inputs),
+            float, count
+        )
+        whale_adj = np.fromiter(
+            (_WHALE_ADJ.get(market.get('whale_sentiment', 'neutral'), 0.0) for _, _, _, _, market in inputs),
+            float, count
+        )
+        
+        scores = _score_kernel(base, migration, dev_risk, liquidity_adj, whale_adj).tolist()
+        potentials = _potential_kernel(base, migration, bonding).tolist()
+        
+        timestamp = datetime.utcnow()
+        signals = []
+        for (token_data, sniping_analysis, pump_metrics, dev_analysis, market_conditions), score, potential in zip(
+            inputs, scores, potentials
+        ):
+            risk_level = self._determine_risk_level(pump_metrics, dev_analysis)
+            signals.append(OpportunitySignal(
+                mint_address=token_data.get('mint', ''),
+                token_name=token_data.get('name', 'Unknown'),
+                overall_score=score,
+                risk_level=risk_level,
+                potential_return=potential,
+                confidence_level=sniping_analysis.confidence_level,
+                time_sensitivity=self._assess_time_sensitivity(sniping_analysis, pump_metrics, market_conditions),
+                entry_recommendation=self._generate_entry_recommendation(score, risk_level, market_conditions),
+                key_factors=self._identify_key_factors(sniping_analysis, pump_metrics, dev_analysis),
+                risk_factors=self._identify_risk_factors(sniping_analysis, pump_metrics, dev_analysis),
+                timestamp=timestamp
+            ))
+        
+        now = time.monotonic()
+        if len(self._signal_cache) > CACHE_SWEEP_SIZE:
+            self._signal_cache = {
+                mint: entry for mint, entry in self._signal_cache.items()
+                if now - entry[1] < SIGNAL_CACHE_TTL_S
+            }
+        for signal in signals:
+            self._signal_cache[signal.mint_address] = (signal, now)
+        
+        return signals
     
     def _determine_risk_level(self, pump_metrics, dev_analysis) -> str:
         """Determine overall risk level"""
-        try:
-            rug_risk = pump_metrics.rug_risk_score
-            dev_risk_level = dev_analysis.get('risk_level', 'unknown')
-            
-            if rug_risk < 2.0 and dev_risk_level in ['very_low', 'low']:
-                return 'low'
-            elif rug_risk < 4.0 and dev_risk_level in ['very_low', 'low', 'medium']:
-                return 'medium'
-            elif rug_risk < 6.0:
-                return 'high'
-            else:
-                return 'very_high'
-                
-        except Exception as e:
-            logger.error(f"Error determining risk level: {str(e)}")
-            return 'unknown'
-    
-    async def _estimate_potential_return(self, token_data, sniping_analysis, pump_metrics) -> float:
-        """Estimate potential return percentage"""
-        try:
-            # Base potential from bonding curve progress
-            bonding_progress = pump_metrics.bonding_curve_progress
-            base_potential = (1.0 - bonding_progress) * 200  # Up to 200% to graduation
-            
-            # Adjust for token quality
-            quality_multiplier = sniping_analysis.overall_score / 10.0
-            
-            # Adjust for migration probability
-            migration_multiplier = pump_metrics.migration_probability
-            
-            # Calculate potential return
-            potential_return = base_potential * quality_multiplier * migration_multiplier
-            
-            # Add post-graduation potential if high quality
-            if sniping_analysis.overall_score > 8.0 and pump_metrics.migration_probability > 0.8:
-                potential_return += 100  # Additional 100% post-graduation potential
-            
-            return min(potential_return, 1000)  # Cap at 1000%
-            
-        except Exception as e:
-            logger.error(f"Error estimating potential return: {str(e)}")
-            return 0.0
+        rug_risk = pump_metrics.rug_risk_score
+        if rug_risk < 0.0:
+            rug_bucket = 0
+        elif rug_risk < 6.0:
+            rug_bucket = int(rug_risk)
+        else:
+            rug_bucket = 6  # Also NaN, which fails every comparison in the original chain
+        
+        levels, default = _RISK_TABLE[rug_bucket]
+        return levels.get(dev_analysis.get('risk_level', 'unknown'), default)
     
     def _assess_time_sensitivity(self, sniping_analysis, pump_metrics, market_conditions) -> str:
         """Assess time sensitivity of opportunity"""
-        try:
-            bonding_progress = pump_metrics.bonding_curve_progress
-            whale_sentiment = market_conditions.get('whale_sentiment', 'neutral')
-            
-            if bonding_progress > 0.8:
-                return 'very_high'  # Near graduation
-            elif bonding_progress > 0.6 and whale_sentiment == 'bullish':
-                return 'high'
-            elif whale_sentiment == 'bullish':
-                return 'medium'
-            else:
-                return 'low'
-                
-        except Exception as e:
-            logger.error(f"Error assessing time sensitivity: {str(e)}")
-            return 'unknown'
+        bonding_progress = pump_metrics.bonding_curve_progress
+        whale_sentiment = market_conditions.get('whale_sentiment', 'neutral')
+        
+        if bonding_progress > 0.8:
+            return 'very_high'  # Near graduation
+        elif bonding_progress > 0.6 and whale_sentiment == 'bullish':
+            return 'high'
+        elif whale_sentiment == 'bullish':
+            return 'medium'
+        else:
+            return 'low'
     
     def _generate_entry_recommendation(self, score, risk_level, market_conditions) -> str:
         """Generate entry recommendation"""
-        try:
-            exec_recommendation = market_conditions.get('execution_recommendation', 'execute_with_caution')
-            
-            if score >= 8.5 and risk_level in ['low', 'medium'] and exec_recommendation != 'wait_for_better_liquidity':
-                return 'strong_buy'
-            elif score >= 7.5 and risk_level in ['low', 'medium']:
-                return 'buy'
-            elif score >= 6.5 and risk_level == 'low':
-                return 'consider'
-            elif score >= 5.0:
-                return 'monitor'
-            else:
-                return 'avoid'
-                
-        except Exception as e:
-            logger.error(f"Error generating entry recommendation: {str(e)}")
-            return 'monitor'
+        # Below the lowest band, and NaN (which bisect would place in the top band), is always avoid
+        if not score >= _SCORE_BANDS[0]:
+            return 'avoid'
+        
+        exec_recommendation = market_conditions.get('execution_recommendation', 'execute_with_caution')
+        
+        return _REC_TABLE[bisect.bisect_right(_SCORE_BANDS, score)][_RISK_CLASS.get(risk_level, 2)][
+            exec_recommendation != 'wait_for_better_liquidity'
+        ]
     
-    def _identify_key_factors(self, sniping_analysis, pump_metrics, dev_analysis) -> List[str]:
+    def _identify_key_factors(self, sniping_analysis, pump_metrics, dev_analysis) -> Tuple[str, ...]:
         """Identify key positive factors"""
         factors = []
         
-        try:
-            if sniping_analysis.overall_score > 8.0:
-                factors.append("High quality token analysis")
-            
-            if pump_metrics.migration_probability > 0.8:
-                factors.append("High migration probability")
-            
-            if pump_metrics.rug_risk_score < 2.0:
-                factors.append("Very low rug risk")
-            
-            if dev_analysis.get('risk_level') == 'very_low':
-                factors.append("Trusted developer")
-            
-            if pump_metrics.community_engagement > 0.7:
-                factors.append("Strong community engagement")
-            
-            if 0.1 < pump_metrics.bonding_curve_progress < 0.7:
-                factors.append("Optimal bonding curve position")
-            
-        except Exception as e:
-            logger.error(f"Error identifying key factors: {str(e)}")
+        if sniping_analysis.overall_score > 8.0:
+            factors.append("High quality token analysis")
+        
+        if pump_metrics.migration_probability > 0.8:
+            factors.append("High migration probability")
+        
+        if pump_metrics.rug_risk_score < 2.0:
+            factors.append("Very low rug risk")
+        
+        if dev_analysis.get('risk_level') == 'very_low':
+            factors.append("Trusted developer")
         
-        return factors
+        if pump_metrics.community_engagement > 0.7:
+            factors.append("Strong community engagement")
+        
+        if 0.1 < pump_metrics.bonding_curve_progress < 0.7:
+            factors.append("Optimal bonding curve position")
+        
+        return _shared_factors(factors)
     
-    def _identify_risk_factors(self, sniping_analysis, pump_metrics, dev_analysis) -> List[str]:
+    def _identify_risk_factors(self, sniping_analysis, pump_metrics, dev_analysis) -> Tuple[str, ...]:
         """Identify key risk factors"""
         factors = []
         
-        try:
-            if pump_metrics.rug_risk_score > 6.0:
-                factors.append("High rug pull risk")
-            
-            if dev_analysis.get('risk_level') in ['high', 'very_high']:
-                factors.append("Risky developer profile")
-            
-            if pump_metrics.migration_probability < 0.3:
-                factors.append("Low migration probability")
-            
-            if pump_metrics.bonding_curve_progress > 0.9:
-                factors.append("Late stage entry risk")
-            
-            if sniping_analysis.confidence_level < 0.5:
-                factors.append("Low analysis confidence")
-            
-            if len(sniping_analysis.red_flags) > 2:
-                factors.append("Multiple red flags detected")
-            
-        except Exception as e:
-            logger.error(f"Error identifying risk factors: {str(e)}")
+        if pump_metrics.rug_risk_score > 6.0:
+            factors.append("High rug pull risk")
+        
+        if dev_analysis.get('risk_level') in ['high', 'very_high']:
+            factors.append("Risky developer profile")
+        
+        if pump_metrics.migration_probability < 0.3:
+            factors.append("Low migration probability")
+        
+        if pump_metrics.bonding_curve_progress > 0.9:
+            factors.append("Late stage entry risk")
+        
+        if sniping_analysis.confidence_level < 0.5:
+            factors.append("Low analysis confidence")
+        
+        if len(sniping_analysis.red_flags) > 2:
+            factors.append("Multiple red flags detected")
         
-        return factors
+        return _shared_factors(factors)
     
-    def _meets_criteria(self, opportunity: OpportunitySignal) -> bool:
-        """Check if opportunity meets scanning criteria"""
-        try:
+    @staticmethod
+    def _make_meets_criteria(min_score: float, min_confidence: float) -> Callable[[OpportunitySignal], bool]:
+        """Build the scanning criteria check with the current thresholds bound as closure constants"""
+        def meets_criteria(opportunity: OpportunitySignal) -> bool:
             return (
-                opportunity.overall_score >= self.min_score_threshold and
-                opportunity.confidence_level >= self.min_confidence and
+                opportunity.overall_score >= min_score and
+                opportunity.confidence_level >= min_confidence and
                 opportunity.risk_level != 'very_high'
             )
-            
-        except Exception as e:
-            logger.error(f"Error checking criteria: {str(e)}")
-            return False
+        
+        return meets_criteria
     
     def _recently_analyzed(self, mint_address: str) -> bool:
         """Check if token was recently analyzed"""
         try:
-            cutoff_time = datetime.utcnow() - timedelta(minutes=10)
-            
-            for opportunity in self.opportunity_history:
-                if (opportunity.mint_address == mint_address and 
-                    opportunity.timestamp > cutoff_time):
-                    return True
-            
-            return False
+            analyzed_at = self._last_analyzed.get(mint_address)
+            return analyzed_at is not None and time.monotonic() - analyzed_at < RECENT_ANALYSIS_WINDOW_S
             
         except Exception as e:
-            logger.error(f"Error checking recent analysis: {str(e)}")
+            logger.error("Error checking recent analysis: %s", e)
             return False
     
     async def _rank_opportunities(self, opportunities: List[OpportunitySignal]) -> List[OpportunitySignal]:
         """Rank opportunities by potential"""
         try:
-            # Sort by overall score, then by potential return
-            ranked = sorted(
+            # Top 10 by overall score, then by potential return
+            return heapq.nlargest(
+                10,
                 opportunities,
-                key=lambda x: (x.overall_score, x.potential_return),
-                reverse=True
+                key=attrgetter('overall_score', 'potential_return')
             )
             
-            return ranked[:10]  # Return top 10
-            
         except Exception as e:
-            logger.error(f"Error ranking opportunities: {str(e)}")
+            logger.error("Error ranking opportunities: %s", e)
             return opportunities
     
     async def _update_active_opportunities(self, opportunities: List[OpportunitySignal]):
         """Update active opportunities tracking"""
         try:
+            now = time.monotonic()
+            
             # Add new opportunities
             for opportunity in opportunities:
                 self.active_opportunities[opportunity.mint_address] = opportunity
+                self._store_active_slot(opportunity)
+                self._active_since[opportunity.mint_address] = now
+                heapq.heappush(self._expiry_heap, (now, opportunity.mint_address))
+            changed = bool(opportunities)
             
             # Remove old opportunities (older than 1 hour)
-            cutoff_time = datetime.utcnow() - timedelta(hours=1)
-            expired_addresses = [
-                addr for addr, opp in self.active_opportunities.items()
-                if opp.timestamp < cutoff_time
-            ]
-            
-            for addr in expired_addresses:
-                del self.active_opportunities[addr]
+            cutoff = now - ACTIVE_OPPORTUNITY_TTL_S
+            while self._expiry_heap and self._expiry_heap[0][0] < cutoff:
+                added_at, addr = heapq.heappop(self._expiry_heap)
+                # A re-added mint has a newer time and stays
+                if self._active_since.get(addr) == added_at:
+                    del self.active_opportunities[addr]
+                    del self._active_since[addr]
+                    self._free_active_slot(addr)
+                    changed = True
+            
+            if changed:
+                self._topk_cache = None
             
             # Update history
             self.opportunity_history.extend(opportunities)
-            
-            # Keep only recent history
-            if len(self.opportunity_history) > 1000:
-                self.opportunity_history = self.opportunity_history[-1000:]
+            for opportunity in opportunities:
+                self._last_analyzed[opportunity.mint_address] = now
+                self._last_analyzed.move_to_end(opportunity.mint_address)
+            while len(self._last_analyzed) > RECENT_ANALYSIS_LIMIT:
+                self._last_analyzed.popitem(last=False)
                 
         except Exception as e:
-            logger.error(f"Error updating active opportunities: {str(e)}")
+            logger.error("Error updating active opportunities: %s", e)
+    
+    def _store_active_slot(self, opportunity: OpportunitySignal):
+        """Write an active opportunity's score and risk into its slot, appending one if the mint is new"""
+        slot = self._mint_index.get(opportunity.mint_address)
+        if slot is None:
+            slot = len(self._slot_mints)
+            if slot == len(self._slot_scores):
+                self._slot_scores = np.resize(self._slot_scores, slot * 2)
+                self._slot_risk = np.resize(self._slot_risk, slot * 2)
+            self._mint_index[opportunity.mint_address] = slot
+            self._slot_mints.append(opportunity.mint_address)
+        
+        self._slot_scores[slot] = opportunity.overall_score
+        self._slot_risk[slot] = _RISK_CODES[opportunity.risk_level]
+    
+    def _free_active_slot(self, mint_address: str):
+        """Release a mint's slot by moving the last live slot into it"""
+        slot = self._mint_index.pop(mint_address)
+        moved = self._slot_mints.pop()
+        if moved != mint_address:
+            last = len(self._slot_mints)
+            self._slot_scores[slot] = self._slot_scores[last]
+            self._slot_risk[slot] = self._slot_risk[last]
+            self._slot_mints[slot] = moved
+            self._mint_index[moved] = slot
     
     async def _log_top_opportunities(self, opportunities: List[OpportunitySignal]):
         """Log top opportunities"""
         try:
-            if not opportunities:
+            if not opportunities or not logger.isEnabledFor(logging.INFO):
                 return
             
-            logger.info(f"Found {len(opportunities)} high-potential opportunities:")
+            logger.info("Found %d high-potential opportunities:", len(opportunities))
             
             for i, opp in enumerate(opportunities[:5], 1):
                 logger.info(
-                    f"{i}. {opp.token_name} ({opp.mint_address[:8]}...) - "
-                    f"Score: {opp.overall_score:.1f}, "
-                    f"Risk: {opp.risk_level}, "
-                    f"Potential: {opp.potential_return:.0f}%, "
-                    f"Recommendation: {opp.entry_recommendation}"
+                    "%d. %s (%s...) - Score: %.1f, Risk: %s, Potential: %.0f%%, Recommendation: %s",
+                    i, opp.token_name, opp.mint_address[:8], opp.overall_score,
+                    opp.risk_level, opp.potential_return, opp.entry_recommendation
                 )
                 
         except Exception as e:
-            logger.error(f"Error logging opportunities: {str(e)}")
+            logger.error("Error logging opportunities: %s", e)
     
     def get_top_opportunities(self, limit: int = 5) -> List[OpportunitySignal]:
         """Get current top opportunities"""
         try:
-            # Sort active opportunities by score
-            sorted_opportunities = sorted(
-                self.active_opportunities.values(),
-                key=lambda x: x.overall_score,
-                reverse=True
-            )
+            if self._topk_cache is None or self._topk_cache[0] != limit:
+                top = heapq.nlargest(limit, self.active_opportunities.values(), key=attrgetter('overall_score'))
+                self._topk_cache = (limit, top)
             
-            return sorted_opportunities[:limit]
+            return list(self._topk_cache[1])
             
         except Exception as e:
-            logger.error(f"Error getting top opportunities: {str(e)}")
+            logger.error("Error getting top opportunities: %s", e)
             return []
     
     def get_opportunity_summary(self) -> Dict[str, Any]:
         """Get opportunity scanning summary"""
         try:
-            active_count = len(self.active_opportunities)
+            # The slot arrays back the statistics, so count from them rather than the dict
+            active_count = len(self._slot_mints)
             
             if active_count == 0:
                 return {
@@ -494,29 +755,33 @@ class OpportunityScanner:
                     'top_score': 0.0,
                     'average_score': 0.0,
                     'risk_distribution': {},
-                    'scanning_active': self.scanning_active
+                    'scanning_active': self.scanning_active,
+                    'prefilter_hit_rate': self._prefilter_hit_rate()
                 }
             
-            scores = [opp.overall_score for opp in self.active_opportunities.values()]
-            risk_levels = [opp.risk_level for opp in self.active_opportunities.values()]
-            
-            risk_distribution = {}
-            for risk in risk_levels:
-                risk_distribution[risk] = risk_distribution.get(risk, 0) + 1
+            scores = self._slot_scores[:active_count]
+            risk_counts = np.bincount(self._slot_risk[:active_count], minlength=len(_RISK_NAMES))
             
             return {
                 'active_opportunities': active_count,
-                'top_score': max(scores),
-                'average_score': sum(scores) / len(scores),
-                'risk_distribution': risk_distribution,
+                'top_score': float(scores.max()),
+                'average_score': float(scores.mean()),
+                'risk_distribution': {
+                    name: int(count) for name, count in zip(_RISK_NAMES, risk_counts) if count
+                },
                 'scanning_active': self.scanning_active,
+                'prefilter_hit_rate': self._prefilter_hit_rate(),
                 'last_scan': datetime.utcnow().isoformat()
             }
             
         except Exception as e:
-            logger.error(f"Error getting opportunity summary: {str(e)}")
+            logger.error("Error getting opportunity summary: %s", e)
             return {}
     
+    def _prefilter_hit_rate(self) -> float:
+        """Share of checked tokens the pre-analysis filter rejected"""
+        return self._prefilter_rejected / self._prefilter_checked if self._prefilter_checked else 0.0
+    
     def stop_scanning(self):
         """Stop opportunity scanning"""
         self.scanning_active = False
@@ -534,7 +799,8 @@ async def run_opportunity_scanner_example():
             'min_score_threshold': 7.0,
             'max_rug_risk': 3.0,
             'min_confidence': 0.6,
-            'scan_interval': 30
+            'scan_interval': 30,
+            'max_bonding_curve_progress': 0.9
         }
         
         # Start scanning
@@ -578,8 +844,8 @@ async def run_opportunity_scanner_example():
         
         print("⚠️  Remember: This is educational only. Always DYOR!")
         
-    except Exception as e:
-        logger.error(f"Error in scanner example: {str(e)}")
+    except Exception:
+        logger.exception("Error in scanner example")
 
 if __name__ == "__main__":
     asyncio.run(run_opportunity_scanner_example())
@@ -2,163 +2,148 @@
 Test suite for the Pump.fun Trading Bot
 """
 import asyncio
-import unittest
-import logging
-from unittest.mock import Mock, patch, AsyncMock
-from datetime import datetime, timedelta
-import sys
-import os
+import pytest
+from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from src.main import PumpFunTradingBot
-from src.data.data_processor import DataProcessor
+from src.main import EnhancedPumpFunTradingBot
 from src.trading.advanced_sniping_strategy import AdvancedSnipingStrategy
 from src.trading.long_term_strategy import LongTermStrategy
-from src.wallets.wallet_manager import WalletManager
-from src.monitoring.safety_circuit import SafetyCircuit
 
-class TestTradingBot(unittest.TestCase):
+# Initialized components come from the fixtures in conftest.py
+
+# Token fixtures shared read-only by every test; the sniping token is created at import so it still reads as new
+SNIPE_TOKEN = MappingProxyType({
+    'mint': 'test_mint_address',
+    'name': 'Test Token',
+    'symbol': 'TEST',
+    'creator': 'test_creator',
+    'market_cap': 50000,
+    'created_timestamp': datetime.utcnow().timestamp()
+})
+
+LT_TOKEN = MappingProxyType({
+    'mint': 'test_mint_address',
+    'name': 'Test Utility Token',
+    'symbol': 'TUT',
+    'description': 'A test token with real utility',
+    'market_cap': 1000000,
+    'holder_count': 5000
+})
+
+SNIPE_RECS = frozenset({"strong_buy", "buy", "hold", "avoid", "skip"})
+LT_RECS = frozenset({"strong_buy", "buy", "accumulate", "hold", "reduce", "sell", "avoid"})
+
+# (strategy class, analysis method, token, allowed recommendations)
+STRATEGY_CASES = [
+    (AdvancedSnipingStrategy, "analyze_new_token", SNIPE_TOKEN, SNIPE_RECS),
+    (LongTermStrategy, "analyze_token_fundamentals", LT_TOKEN, LT_RECS),
+]
+STRATEGY_IDS = ["sniping", "long_term"]
+
+@pytest.mark.asyncio
+class TestTradingBot:
     """Test cases for the main trading bot"""
     
-    def setUp(self):
-        """Setup test environment"""
-        self.bot = PumpFunTradingBot()
-        
-    async def test_bot_initialization(self):
+    @pytest.mark.slow
+    async def test_bot_initialization(self, bot):
         """Test bot initialization"""
-        try:
-            await self.bot.initialize()
-            self.assertTrue(len(self.bot.components) > 0)
-            self.assertIn('data_processor', self.bot.components)
-            self.assertIn('safety_circuit', self.bot.components)
-            print("✓ Bot initialization test passed")
-        except Exception as e:
-            print(f"✗ Bot initialization test failed: {str(e)}")
-            
-    async def test_safety_circuit(self):
+        assert len(bot._component_tiers) > 0
+        assert bot.data_processor is not None
+        assert bot.safety_circuit is not None
+    
+    async def test_safety_circuit(self, safety_circuit):
         """Test safety circuit functionality"""
-        try:
-            safety_circuit = SafetyCircuit()
-            await safety_circuit.initialize()
-            
-            # Test normal operation
-            self.assertTrue(safety_circuit.is_trading_allowed())
-            
-            # Test emergency stop
-            await safety_circuit.emergency_stop("Test emergency stop")
-            self.assertFalse(safety_circuit.is_trading_allowed())
-            
-            print("✓ Safety circuit test passed")
-        except Exception as e:
-            print(f"✗ Safety circuit test failed: {str(e)}")
+        # Test normal operation
+        assert safety_circuit.is_trading_allowed()
+        
+        # Test emergency stop
+        await safety_circuit.emergency_stop("Test emergency stop")
+        assert not safety_circuit.is_trading_allowed()
 
-class TestDataProcessor(unittest.TestCase):
-    """Test cases for data processing"""
+@pytest.mark.asyncio
+class TestTokenIngestion:
+    """Test cases for pushed-token ingestion in the trading loop"""
     
-    async def test_data_processor_initialization(self):
-        """Test data processor initialization"""
-        try:
-            processor = DataProcessor()
-            await processor.initialize()
-            print("✓ Data processor initialization test passed")
-        except Exception as e:
-            print(f"✗ Data processor initialization test failed: {str(e)}")
-
-class TestTradingStrategies(unittest.TestCase):
-    """Test cases for trading strategies"""
+    async def test_drains_pushed_token_burst(self):
+        """Test every token queued in one burst is returned together"""
+        queue = asyncio.Queue()
+        for mint in ("mint_a", "mint_b", "mint_c"):
+            queue.put_nowait({'mint': mint})
+        
+        bot = EnhancedPumpFunTradingBot()
+        bot.data_processor = SimpleNamespace(new_token_queue=queue)
+        
+        tokens = await bot._next_new_tokens()
+        assert [token['mint'] for token in tokens] == ["mint_a", "mint_b", "mint_c"]
+        assert queue.empty()
     
-    async def test_sniping_strategy(self):
-        """Test sniping strategy"""
-        try:
-            # Mock data processor
-            mock_processor = Mock()
-            strategy = AdvancedSnipingStrategy(mock_processor)
-            await strategy.initialize()
-            
-            # Test token analysis with mock data
-            mock_token_data = {
-                'mint': 'test_mint_address',
-                'name': 'Test Token',
-                'symbol': 'TEST',
-                'creator': 'test_creator',
-                'market_cap': 50000,
-                'created_timestamp': datetime.utcnow().timestamp()
-            }
-            
-            analysis = await strategy.analyze_new_token(mock_token_data)
-            self.assertIsNotNone(analysis)
-            self.assertIn(analysis.recommendation, ["strong_buy", "buy", "hold", "avoid", "skip"])
-            
-            print("✓ Sniping strategy test passed")
-        except Exception as e:
-            print(f"✗ Sniping strategy test failed: {str(e)}")
+    async def test_long_term_poll_is_throttled(self):
+        """Test token bursts do not re-poll long-term opportunities within the interval"""
+        calls = []
+        
+        async def get_long_term_opportunities():
+            calls.append(1)
+            return []
+        
+        bot = EnhancedPumpFunTradingBot()
+        bot.data_processor = SimpleNamespace(get_long_term_opportunities=get_long_term_opportunities)
+        
+        for _ in range(5):
+            await bot._process_long_term_opportunities()
+        assert len(calls) == 1
     
-    async def test_long_term_strategy(self):
-        """Test long-term strategy"""
-        try:
-            # Mock data processor
-            mock_processor = Mock()
-            strategy = LongTermStrategy(mock_processor)
-            await strategy.initialize()
-            
-            # Test fundamental analysis with mock data
-            mock_token_data = {
-                'mint': 'test_mint_address',
-                'name': 'Test Utility Token',
-                'symbol': 'TUT',
-                'description': 'A test token with real utility',
-                'market_cap': 1000000,
-                'holder_count': 5000
-            }
-            
-            analysis = await strategy.analyze_token_fundamentals(mock_token_data)
-            self.assertIsNotNone(analysis)
-            self.assertIn(analysis.recommendation, ["strong_buy", "buy", "accumulate", "hold", "reduce", "sell", "avoid"])
-            
-            print("✓ Long-term strategy test passed")
-        except Exception as e:
-            print(f"✗ Long-term strategy test failed: {str(e)}")
+    async def test_halts_when_circuit_disallows_trading(self):
+        """Test the trading loop stops dispatching without waiting for the safety poll"""
+        calls = []
+        
+        async def process_new_tokens():
+            calls.append(1)
+            await asyncio.sleep(0)
+        
+        bot = EnhancedPumpFunTradingBot()
+        bot.safety_circuit = SimpleNamespace(is_trading_allowed=lambda: False)
+        bot._process_new_tokens_enhanced = process_new_tokens
+        
+        loop_task = asyncio.create_task(bot._main_trading_loop())
+        await asyncio.sleep(0.01)
+        loop_task.cancel()
+        await loop_task
+        
+        assert not bot.trading_allowed.is_set()
+        assert calls == []
 
-class TestWalletManager(unittest.TestCase):
-    """Test cases for wallet management"""
+class TestComponentSmoke:
+    """Initialization smoke tests for standalone components"""
     
-    async def test_wallet_manager_initialization(self):
-        """Test wallet manager initialization"""
-        try:
-            wallet_manager = WalletManager()
-            await wallet_manager.initialize()
-            print("✓ Wallet manager initialization test passed")
-        except Exception as e:
-            print(f"✗ Wallet manager initialization test failed: {str(e)}")
+    @pytest.mark.parametrize("component", ["data_processor", "wallet_manager", "safety_circuit"])
+    def test_initializes(self, request, component):
+        """Test the component's conftest fixture builds and initializes it"""
+        assert request.getfixturevalue(component) is not None
 
-async def run_all_tests():
-    """Run all test cases"""
-    print("Starting Pump.fun Trading Bot Test Suite...")
-    print("=" * 50)
-    
-    # Test bot initialization
-    bot_test = TestTradingBot()
-    await bot_test.test_bot_initialization()
-    await bot_test.test_safety_circuit()
-    
-    # Test data processor
-    data_test = TestDataProcessor()
-    await data_test.test_data_processor_initialization()
-    
-    # Test trading strategies
-    strategy_test = TestTradingStrategies()
-    await strategy_test.test_sniping_strategy()
-    await strategy_test.test_long_term_strategy()
-    
-    # Test wallet manager
-    wallet_test = TestWalletManager()
-    await wallet_test.test_wallet_manager_initialization()
+@pytest.mark.asyncio
+class TestTradingStrategies:
+    """Test cases for trading strategies"""
     
-    print("=" * 50)
-    print("Test suite completed!")
-
-if __name__ == "__main__":
-    asyncio.run(run_all_tests())
+    @pytest.mark.parametrize("strategy_cls, fn, data, allowed", STRATEGY_CASES, ids=STRATEGY_IDS)
+    async def test_strategy_recommendation(self, stub_processor, strategy_cls, fn, data, allowed):
+        """Test each strategy's analysis yields one of its recommendations"""
+        strategy = strategy_cls(stub_processor)
+        await strategy.initialize()
+        
+        analysis = await getattr(strategy, fn)(data)
+        assert analysis is not None
+        assert analysis.recommendation in allowed
 
+class TestStrategyPerformance:
+    """Throughput benchmarks for strategy analysis; compare runs with --benchmark-compare-fail=mean:10%"""
+    
+    @pytest.mark.parametrize("strategy_cls, fn, data, allowed", STRATEGY_CASES, ids=STRATEGY_IDS)
+    def test_strategy_analysis_perf(self, benchmark, event_loop, stub_processor, strategy_cls, fn, data, allowed):
+        """Benchmark one strategy analysis on the session loop"""
+        strategy = strategy_cls(stub_processor)
+        event_loop.run_until_complete(strategy.initialize())
+        analyze = getattr(strategy, fn)
+        
+        analysis = benchmark(lambda: event_loop.run_until_complete(analyze(data)))
+        assert analysis.recommendation in allowed